@@ -0,0 +1,139 @@
+"""
+Statistiques vectorisées sur les labyrinthes (dépendance optionnelle : NumPy)
+
+Les calculs travaillent directement sur les tableaux de bits de murs de Maze
+(_east et _south) et traitent un lot de labyrinthes de mêmes dimensions
+en quelques opérations sur des tableaux entiers, sans boucle Python par cellule.
+
+Exemple :
+    from analytics import report, report_batch
+    rapport = report(Maze.gen_wilson(100, 100))
+    rapports = report_batch([Maze.gen_wilson(100, 100) for _ in range(1000)])
+    rapports["dead_ends"].mean()
+"""
+import numpy as np
+
+
+def passages(mazes):
+    """
+    Décode les bits de murs d'un lot de labyrinthes de mêmes dimensions
+
+    Argument:
+        mazes (list): labyrinthes (Maze) de mêmes dimensions
+
+    Retour:
+        (est, sud): tableaux booléens de forme (nombre, height, width),
+                    True si la cellule a un passage vers l'est (resp. le sud)
+    """
+    h, w = mazes[0].height, mazes[0].width
+    assert all(m.height == h and m.width == w for m in mazes), \
+        "Erreur : les labyrinthes d'un même lot doivent avoir les mêmes dimensions"
+    def decoder(attribut):
+        bits = np.stack([np.frombuffer(getattr(m, attribut), dtype=np.uint8) for m in mazes])
+        murs = np.unpackbits(bits, axis=1, bitorder="little")[:, :h*w]
+        return ~murs.reshape(len(mazes), h, w).astype(bool)
+    est, sud = decoder("_east"), decoder("_south")
+    # Les bits de bord ne correspondent à aucun passage
+    est[:, :, -1] = False
+    sud[:, -1, :] = False
+    return est, sud
+
+
+def _runs(ouvert):
+    """
+    Longueurs des suites maximales de passages consécutifs le long du dernier axe
+
+    Argument:
+        ouvert (ndarray): tableau booléen de forme (nombre, lignes, colonnes)
+
+    Retour:
+        (lot, longueurs): indice du labyrinthe et longueur (en passages) de chaque suite
+    """
+    bord = np.zeros(ouvert.shape[:2] + (1,), dtype=np.int8)
+    d = np.diff(np.concatenate([bord, ouvert.astype(np.int8), bord], axis=2), axis=2)
+    debuts, fins = np.nonzero(d == 1), np.nonzero(d == -1)
+    return debuts[0], fins[2] - debuts[2]
+
+
+def report_batch(mazes):
+    """
+    Rapport statistique pour un lot de labyrinthes de mêmes dimensions
+
+    Argument:
+        mazes (list): labyrinthes (Maze) de mêmes dimensions
+
+    Retour:
+        (ndarray structuré): un enregistrement par labyrinthe avec les champs
+          - degree (5,)        : nombre de cellules de degré 0 à 4
+          - dead_ends          : culs-de-sac (degré 1)
+          - straight           : cellules de couloir en ligne droite (degré 2, passages opposés)
+          - turns              : virages (degré 2, passages perpendiculaires)
+          - junctions          : embranchements (degré 3 ou 4)
+          - corridors          : nombre de couloirs droits (suites maximales de passages alignés)
+          - corridor_max       : longueur du plus long couloir droit (en passages)
+          - corridor_mean      : longueur moyenne des couloirs droits
+          - corridor_hist (L,) : corridor_hist[l] = nombre de couloirs droits de longueur l
+    """
+    nombre = len(mazes)
+    h, w = mazes[0].height, mazes[0].width
+    est, sud = passages(mazes)
+    ouest = np.zeros_like(est)
+    ouest[:, :, 1:] = est[:, :, :-1]
+    nord = np.zeros_like(sud)
+    nord[:, 1:, :] = sud[:, :-1, :]
+    deg = est.astype(np.int8) + ouest + sud + nord
+
+    droit = (deg == 2) & ((est & ouest) | (nord & sud))
+    virage = (deg == 2) & ~droit
+
+    # Couloirs droits : horizontaux (lignes) et verticaux (colonnes)
+    lotH, longH = _runs(est)
+    lotV, longV = _runs(sud.transpose(0, 2, 1))
+    lot = np.concatenate([lotH, lotV])
+    longueurs = np.concatenate([longH, longV])
+    hist = np.zeros((nombre, max(h, w)), dtype=np.int64)
+    np.add.at(hist, (lot, longueurs), 1)
+    corridors = hist.sum(axis=1)
+    total = np.bincount(lot, weights=longueurs, minlength=nombre)
+
+    dtype = [
+        ("degree", np.int64, (5,)),
+        ("dead_ends", np.int64),
+        ("straight", np.int64),
+        ("turns", np.int64),
+        ("junctions", np.int64),
+        ("corridors", np.int64),
+        ("corridor_max", np.int64),
+        ("corridor_mean", np.float64),
+        ("corridor_hist", np.int64, (max(h, w),)),
+    ]
+    rapports = np.zeros(nombre, dtype=dtype)
+    plat = deg.reshape(nombre, -1)
+    rapports["degree"] = np.stack([(plat == d).sum(axis=1) for d in range(5)], axis=1)
+    rapports["dead_ends"] = rapports["degree"][:, 1]
+    rapports["straight"] = droit.reshape(nombre, -1).sum(axis=1)
+    rapports["turns"] = virage.reshape(nombre, -1).sum(axis=1)
+    rapports["junctions"] = rapports["degree"][:, 3] + rapports["degree"][:, 4]
+    rapports["corridors"] = corridors
+    present = hist > 0
+    rapports["corridor_max"] = np.where(present.any(axis=1),
+                                        hist.shape[1] - 1 - np.argmax(present[:, ::-1], axis=1), 0)
+    rapports["corridor_mean"] = np.divide(total, corridors,
+                                          out=np.zeros(nombre), where=corridors > 0)
+    rapports["corridor_hist"] = hist
+    return rapports
+
+
+def report(maze):
+    """
+    Rapport statistique d'un seul labyrinthe (voir report_batch)
+
+    Argument:
+        maze (Maze): labyrinthe à analyser
+
+    Retour:
+        (dict): champ -> valeur (int, float ou ndarray)
+    """
+    rapport = report_batch([maze])[0]
+    return {nom: rapport[nom].item() if rapport[nom].ndim == 0 else rapport[nom].copy()
+            for nom in rapport.dtype.names}
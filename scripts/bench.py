@@ -0,0 +1,386 @@
+"""
+Mesures de performance du générateur de labyrinthes (hors navigateur)
+
+Usage :
+    python scripts/bench.py                      # vérifications de non-régression
+    python scripts/bench.py sweep -o res.json    # balayage complet, résultats JSON
+    python scripts/bench.py sweep --cases gen_wilson,solve_bfs --sizes 10,100,1000 --profile profils/
+    python scripts/bench.py compare ancien.json nouveau.json
+
+Pour chaque opération mesurée, le temps est relevé sur des grilles de taille
+croissante et l'exposant de croissance empirique est estimé (pente log-log).
+Un exposant proche de 1 correspond à un coût linéaire en nombre de cellules.
+"""
+import argparse
+import cProfile
+import datetime
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from main import Maze
+
+
+def chrono(fonction, *args):
+    """
+    Mesure le temps d'exécution d'un appel
+
+    Arguments:
+        fonction (callable): fonction à appeler
+        args: arguments de l'appel
+
+    Retour:
+        (float): durée en secondes
+    """
+    debut = time.perf_counter()
+    fonction(*args)
+    return time.perf_counter() - debut
+
+
+def exposant(mesures):
+    """
+    Estime l'exposant de croissance par régression linéaire en échelle log-log
+
+    Argument:
+        mesures (list): liste de couples (nombre de cellules, durée)
+
+    Retour:
+        (float): pente de log(durée) en fonction de log(cellules)
+    """
+    xs = [math.log(n) for n, _ in mesures]
+    ys = [math.log(max(t, 1e-9)) for _, t in mesures]
+    mx, my = sum(xs)/len(xs), sum(ys)/len(ys)
+    return sum((x-mx)*(y-my) for x, y in zip(xs, ys)) / sum((x-mx)**2 for x in xs)
+
+
+def regression_lineaire(tailles=(100, 316, 1000), seuil=1.3):
+    """
+    Vérifie que get_walls et gen_exploration restent linéaires jusqu'à 1M de cellules
+
+    Arguments:
+        tailles (tuple): côtés des grilles carrées mesurées
+        seuil (float): exposant maximal toléré
+
+    Retour:
+        (bool): True si toutes les opérations respectent le seuil
+    """
+    random.seed(0)
+    cas = {
+        "get_walls": lambda n: chrono(Maze.get_walls, Maze.gen_btree(n, n)),
+        "gen_exploration": lambda n: chrono(Maze.gen_exploration, n, n),
+    }
+    ok = True
+    for nom, mesure in cas.items():
+        mesures = [(n*n, mesure(n)) for n in tailles]
+        k = exposant(mesures)
+        for cellules, duree in mesures:
+            print(f"{nom:16} {cellules:>9} cellules {duree:8.3f} s")
+        print(f"{nom:16} exposant {k:.2f}")
+        ok = ok and k < seuil
+    return ok
+
+
+def str_reference(maze):
+    """
+    Ancienne implémentation de Maze.__str__ (concaténations successives),
+    conservée pour comparer les temps et vérifier l'identité des sorties
+    """
+    txt = ""
+    # Première ligne
+    txt += "┏"
+    for j in range(maze.width-1):
+        txt += "━━━┳"
+    txt += "━━━┓\n"
+    txt += "┃"
+    for j in range(maze.width-1):
+        txt += "   ┃" if (0,j+1) not in maze.neighbors[(0,j)] else "    "
+    txt += "   ┃\n"
+    # Lignes normales
+    for i in range(maze.height-1):
+        txt += "┣"
+        for j in range(maze.width-1):
+            txt += "━━━╋" if (i+1,j) not in maze.neighbors[(i,j)] else "   ╋"
+        txt += "━━━┫\n" if (i+1,maze.width-1) not in maze.neighbors[(i,maze.width-1)] else "   ┫\n"
+        txt += "┃"
+        for j in range(maze.width):
+            txt += "   ┃" if (i+1,j+1) not in maze.neighbors[(i+1,j)] else "    "
+        txt += "\n"
+    # Bas du tableau
+    txt += "┗"
+    for i in range(maze.width-1):
+        txt += "━━━┻"
+    txt += "━━━┛\n"
+    return txt
+
+
+def overlay_reference(maze, content=None):
+    """
+    Ancienne implémentation de Maze.overlay, conservée comme référence
+    """
+    if content is None:
+        content = {(i,j):' ' for i in range(maze.height) for j in range(maze.width)}
+    else:
+        # Python >=3.9
+        #content = content | {(i, j): ' ' for i in range(
+        #    maze.height) for j in range(maze.width) if (i,j) not in content}
+        # Python <3.9
+        new_content = {(i, j): ' ' for i in range(maze.height) for j in range(maze.width) if (i,j) not in content}
+        content = {**content, **new_content}
+    txt = r""
+    # Première ligne
+    txt += "┏"
+    for j in range(maze.width-1):
+        txt += "━━━┳"
+    txt += "━━━┓\n"
+    txt += "┃"
+    for j in range(maze.width-1):
+        txt += " "+content[(0,j)]+" ┃" if (0,j+1) not in maze.neighbors[(0,j)] else " "+content[(0,j)]+"  "
+    txt += " "+content[(0,maze.width-1)]+" ┃\n"
+    # Lignes normales
+    for i in range(maze.height-1):
+        txt += "┣"
+        for j in range(maze.width-1):
+            txt += "━━━╋" if (i+1,j) not in maze.neighbors[(i,j)] else "   ╋"
+        txt += "━━━┫\n" if (i+1,maze.width-1) not in maze.neighbors[(i,maze.width-1)] else "   ┫\n"
+        txt += "┃"
+        for j in range(maze.width):
+            txt += " "+content[(i+1,j)]+" ┃" if (i+1,j+1) not in maze.neighbors[(i+1,j)] else " "+content[(i+1,j)]+"  "
+        txt += "\n"
+    # Bas du tableau
+    txt += "┗"
+    for i in range(maze.width-1):
+        txt += "━━━┻"
+    txt += "━━━┛\n"
+    return txt
+
+
+def comparaison_rendu(tailles=(50, 100, 200)):
+    """
+    Compare le moteur de rendu actuel à l'ancienne implémentation
+
+    Argument:
+        tailles (tuple): côtés des grilles carrées mesurées
+
+    Retour:
+        (bool): True si les sorties sont identiques octet pour octet
+    """
+    random.seed(0)
+    ok = True
+    for n in tailles:
+        laby = Maze.gen_wilson(n, n)
+        path = laby.solve_bfs((0, 0), (n-1, n-1))
+        for nom, actuel, reference in (
+            ("__str__", lambda: str(laby), lambda: str_reference(laby)),
+            ("overlay", lambda: laby.overlay(path), lambda: overlay_reference(laby, path)),
+        ):
+            debut = time.perf_counter()
+            txt = actuel()
+            t1 = time.perf_counter() - debut
+            debut = time.perf_counter()
+            ref = reference()
+            t2 = time.perf_counter() - debut
+            identique = txt.encode() == ref.encode()
+            ok = ok and identique
+            print(f"{nom:8} {n:>5}x{n:<5} actuel {t1:7.3f} s  référence {t2:7.3f} s"
+                  f"  x{t2/max(t1, 1e-9):6.1f}  {'identique' if identique else 'DIFFÉRENT'}")
+    return ok
+
+
+TAILLES = (10, 50, 100, 200, 500, 1000, 2000)
+
+# Labyrinthes de test déjà construits, par taille : {n: (labyrinthe, chemin)}
+_FIXTURES = {}
+
+
+def _labyrinthe_test(n):
+    """
+    Labyrinthe n x n (sidewinder, graine fixe) et son chemin solve_bfs, servant aux solveurs
+    et au rendu ; construit une seule fois par taille, à la création du cas (hors des mesures)
+    """
+    if n not in _FIXTURES:
+        laby = Maze.gen_sidewinder(n, n, random.Random(0))
+        _FIXTURES[n] = (laby, laby.solve_bfs((0, 0), (n-1, n-1)))
+    return _FIXTURES[n]
+
+
+def _sur_labyrinthe(operation):
+    """
+    Cas mesuré sur le labyrinthe de test : le labyrinthe est préparé dès la création
+    de l'appel, avant que mesurer ne le chronomètre
+
+    Argument:
+        operation (callable): operation(laby, chemin, n) -> résultat
+
+    Retour:
+        fonction (côté de la grille) -> appel à chronométrer
+    """
+    def fabrique(n):
+        laby, chemin = _labyrinthe_test(n)
+        return lambda: operation(laby, chemin, n)
+    return fabrique
+
+
+# Opérations mesurées : nom -> fonction (côté de la grille) -> appel à chronométrer
+CAS = {
+    "gen_btree":       lambda n: lambda: Maze.gen_btree(n, n, random.Random(0)),
+    "gen_sidewinder":  lambda n: lambda: Maze.gen_sidewinder(n, n, random.Random(0)),
+    "gen_fusion":      lambda n: lambda: Maze.gen_fusion(n, n, random.Random(0)),
+    "gen_exploration": lambda n: lambda: Maze.gen_exploration(n, n, random.Random(0)),
+    "gen_wilson":      lambda n: lambda: Maze.gen_wilson(n, n, random.Random(0)),
+    "solve_dfs":       _sur_labyrinthe(lambda laby, chemin, n: laby.solve_dfs((0, 0), (n-1, n-1))),
+    "solve_bfs":       _sur_labyrinthe(lambda laby, chemin, n: laby.solve_bfs((0, 0), (n-1, n-1))),
+    "solve_rhr":       _sur_labyrinthe(lambda laby, chemin, n: laby.solve_rhr((0, 0), (n-1, n-1))),
+    "worst_path_len":  _sur_labyrinthe(lambda laby, chemin, n: laby.worst_path_len((0, 0))),
+    "__str__":         _sur_labyrinthe(lambda laby, chemin, n: str(laby)),
+    "overlay":         _sur_labyrinthe(lambda laby, chemin, n: laby.overlay(chemin)),
+}
+
+
+def mesurer(appel, memoire=True, profil=None):
+    """
+    Mesure un appel : durée (meilleure de quelques répétitions pour les appels courts),
+    pic mémoire (tracemalloc, dans une exécution séparée) et profil cProfile optionnel
+
+    Arguments:
+        appel (callable): appel sans argument
+        memoire (bool): mesure aussi le pic d'allocation
+        profil (str): chemin du fichier de statistiques cProfile (None : pas de profil)
+
+    Retour:
+        (dict): {"time": secondes, "peak_bytes": octets ou None}
+    """
+    durees = [chrono(appel)]
+    while durees[-1] < 0.1 and len(durees) < 5:
+        durees.append(chrono(appel))
+    resultat = {"time": min(durees), "peak_bytes": None}
+    if memoire:
+        tracemalloc.start()
+        appel()
+        resultat["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    if profil:
+        profileur = cProfile.Profile()
+        profileur.runcall(appel)
+        profileur.dump_stats(profil)
+    return resultat
+
+
+def balayage(cas=None, tailles=TAILLES, budget=60.0, memoire=True, profils=None):
+    """
+    Mesure chaque opération sur des grilles carrées de taille croissante
+    Une taille est sautée (ainsi que les suivantes) dès que sa durée estimée,
+    extrapolée avec l'exposant observé, dépasse le budget : les opérations
+    quadratiques n'empêchent pas le balayage de se terminer
+
+    Arguments:
+        cas (list): noms des opérations (None : toutes, voir CAS)
+        tailles (tuple): côtés des grilles
+        budget (float): durée maximale estimée d'une mesure, en secondes
+        memoire (bool): mesure le pic mémoire (tracemalloc ralentit nettement l'exécution)
+        profils (str): répertoire où écrire un profil cProfile par mesure (None : pas de profil)
+
+    Retour:
+        (dict): résultats sérialisables en JSON
+    """
+    if profils:
+        os.makedirs(profils, exist_ok=True)
+    resultats = {}
+    for nom in cas or CAS:
+        mesures, sautees = [], []
+        for n in tailles:
+            if len(mesures) >= 1:
+                k = exposant([(m["cells"], m["time"]) for m in mesures]) if len(mesures) >= 2 else 1.0
+                dernier = mesures[-1]
+                estimation = dernier["time"] * (n*n / dernier["cells"]) ** max(k, 1.0)
+                if estimation > budget:
+                    sautees.append(n)
+                    continue
+            profil = os.path.join(profils, f"{nom.strip('_')}-{n}.prof") if profils else None
+            # tracemalloc multiplie la durée : pas de mesure mémoire si elle sortirait du budget
+            avecMemoire = memoire and (not mesures or estimation * 4 <= budget)
+            mesure = mesurer(CAS[nom](n), avecMemoire, profil)
+            mesure.update(size=n, cells=n*n)
+            mesures.append(mesure)
+            memo = f"{mesure['peak_bytes']/1e6:9.1f} Mo" if mesure["peak_bytes"] is not None else "        -"
+            print(f"{nom:16} {n:>5}x{n:<5} {mesure['time']:9.4f} s {memo}", flush=True)
+        k = exposant([(m["cells"], m["time"]) for m in mesures]) if len(mesures) >= 2 else None
+        resultats[nom] = {"runs": mesures, "skipped": sautees, "exponent": k}
+        if k is not None:
+            print(f"{nom:16} exposant {k:.2f}" + (f"  (sautées : {sautees})" if sautees else ""))
+    return {"meta": _contexte(budget), "results": resultats}
+
+
+def _contexte(budget):
+    """
+    Informations permettant de comparer des résultats entre versions
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "commit": commit or None,
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "budget": budget,
+    }
+
+
+def comparer(ancien, nouveau):
+    """
+    Affiche le rapport des durées entre deux fichiers de résultats JSON
+
+    Arguments:
+        ancien (str): chemin des résultats de référence
+        nouveau (str): chemin des nouveaux résultats
+    """
+    with open(ancien) as f:
+        a = json.load(f)
+    with open(nouveau) as f:
+        b = json.load(f)
+    print(f"{a['meta']['commit']} -> {b['meta']['commit']}")
+    for nom, res in b["results"].items():
+        avant = {m["size"]: m for m in a["results"].get(nom, {}).get("runs", [])}
+        for m in res["runs"]:
+            if m["size"] in avant:
+                rapport = m["time"] / max(avant[m["size"]]["time"], 1e-9)
+                print(f"{nom:16} {m['size']:>5}x{m['size']:<5} {avant[m['size']]['time']:9.4f} s"
+                      f" -> {m['time']:9.4f} s  x{rapport:5.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mesures de performance des labyrinthes")
+    commandes = parser.add_subparsers(dest="commande")
+    p = commandes.add_parser("sweep", help="balayage de toutes les opérations")
+    p.add_argument("--cases", help="opérations séparées par des virgules (défaut : toutes)")
+    p.add_argument("--sizes", help="côtés des grilles séparés par des virgules")
+    p.add_argument("--budget", type=float, default=60.0, help="durée maximale estimée par mesure (s)")
+    p.add_argument("--no-memory", action="store_true", help="ne pas mesurer le pic mémoire")
+    p.add_argument("--profile", metavar="REPERTOIRE", help="écrire un profil cProfile par mesure")
+    p.add_argument("-o", "--output", help="fichier JSON de résultats")
+    p = commandes.add_parser("compare", help="comparer deux fichiers de résultats")
+    p.add_argument("ancien")
+    p.add_argument("nouveau")
+    args = parser.parse_args()
+
+    if args.commande == "sweep":
+        cas = args.cases.split(",") if args.cases else None
+        tailles = tuple(int(n) for n in args.sizes.split(",")) if args.sizes else TAILLES
+        resultats = balayage(cas, tailles, args.budget, not args.no_memory, args.profile)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(resultats, f, indent=2)
+    elif args.commande == "compare":
+        comparer(args.ancien, args.nouveau)
+    else:
+        ok = regression_lineaire()
+        ok = comparaison_rendu() and ok
+        sys.exit(0 if ok else 1)
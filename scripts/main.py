@@ -1,5 +1,499 @@
-from pyscript import document
+try:
+    from pyscript import document
+except ImportError:
+    # Exécution hors du navigateur (scripts de mesure, console)
+    document = None
+import random as _random
 from random import *
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from heapq import heappush, heappop
+from itertools import repeat
+import mmap as _mmap
+import asyncio
+import functools
+import numbers
+import os
+import struct
+import time
+import zlib
+
+
+# Format binaire de sérialisation (Maze.to_bytes / Maze.save)
+FORMAT_SIGNATURE = b"MAZE"
+FORMAT_VERSION   = 1
+FORMAT_ENTETE    = "<4sBB16sqIII"
+
+# Image PNG : palette (0 : fond, 1 : mur, 2 : chemin) et taille des blocs IDAT
+PNG_PALETTE = bytes((255, 255, 255,  0, 0, 0,  224, 72, 62))
+PNG_BLOC    = 1 << 20
+
+# Décodage d'un octet de murs en 8 octets 0/1 (bit de poids faible en premier)
+_BITS = [bytes((b >> t) & 1 for t in range(8)) for b in range(256)]
+# Segments de rendu texte indexés par le bit de mur (0 : passage, 1 : mur)
+_CELLULES    = {0: "    ", 1: "   ┃"}
+# Ordre des directions essayées par le suiveur de mur (0 : nord, 1 : sud, 2 : ouest, 3 : est)
+# selon la direction courante : droite, tout droit, gauche, demi-tour
+_MAIN_DROITE = ((3, 0, 2, 1), (2, 1, 3, 0), (0, 2, 1, 3), (1, 3, 0, 2))
+_SEPARATEURS = {0: "   ╋", 1: "━━━╋"}
+
+
+# Instrumentation active (voir Instrumentation), None si les mesures sont désactivées
+_instrumentation = None
+
+
+class Instrumentation:
+    """
+    Mesures optionnelles des opérations sur les labyrinthes, activées par un gestionnaire de contexte :
+        with Instrumentation() as mesures:
+            laby = Maze.gen_wilson(100, 100)
+            laby.solve_bfs((0,0), (99,99))
+        mesures.phases  # [{"phase": "gen_wilson", "time": 0.03, "counters": {...}}, ...]
+    Compteurs : walls_added, walls_removed, cells_visited, random_draws
+    Chronomètres : temps cumulé (inclusif) de chaque génération, résolution, calcul de distances et rendu
+    Chaque opération appelée hors d'une autre opération mesurée forme une phase ;
+    la fonction callback éventuelle reçoit chaque phase dès qu'elle se termine
+    Sans contexte actif, chaque point de mesure se réduit au test d'une variable globale
+    """
+    def __init__(self, callback=None):
+        """
+        Constructeur
+        
+        Argument:
+            callback (callable): fonction appelée avec le dictionnaire de chaque phase terminée
+        """
+        self.counters = {}
+        self.timers   = {}
+        self.phases   = []
+        self.callback = callback
+        self._profondeur = 0
+        self._precedente = None
+
+    def __enter__(self):
+        global _instrumentation
+        self._precedente, _instrumentation = _instrumentation, self
+        return self
+
+    def __exit__(self, *exc):
+        global _instrumentation
+        _instrumentation = self._precedente
+        return False
+
+    def count(self, nom, n=1):
+        """
+        Incrémente un compteur
+        
+        Arguments:
+            nom (str): nom du compteur
+            n (int): incrément
+        """
+        self.counters[nom] = self.counters.get(nom, 0) + n
+
+    def _phase(self, nom, methode, args, kwargs):
+        """
+        Exécute une opération mesurée : chronomètre et, au niveau le plus externe, phase
+        """
+        externe = self._profondeur == 0
+        avant = dict(self.counters) if externe else None
+        self._profondeur += 1
+        debut = time.perf_counter()
+        try:
+            return methode(*args, **kwargs)
+        finally:
+            duree = time.perf_counter() - debut
+            self._profondeur -= 1
+            self.timers[nom] = self.timers.get(nom, 0.0) + duree
+            if externe:
+                phase = {"phase": nom, "time": duree,
+                         "counters": {c: v - avant.get(c, 0) for c, v in self.counters.items()
+                                      if v != avant.get(c, 0)}}
+                self.phases.append(phase)
+                if self.callback is not None:
+                    self.callback(phase)
+
+    def report(self):
+        """
+        Résumé textuel des phases mesurées
+        
+        Retour:
+            txt (str): une ligne par phase
+        """
+        txt = ""
+        for phase in self.phases:
+            compteurs = ", ".join(f"{c}={v}" for c, v in sorted(phase["counters"].items()))
+            txt += f"{phase['phase']:20} {phase['time']*1000:10.2f} ms  {compteurs}\n"
+        return txt
+
+
+def _instrumented(methode):
+    """
+    Décorateur des opérations mesurables (générateurs, solveurs, rendus...)
+    """
+    nom = methode.__name__
+    @functools.wraps(methode)
+    def enveloppe(*args, **kwargs):
+        if _instrumentation is None:
+            return methode(*args, **kwargs)
+        return _instrumentation._phase(nom, methode, args, kwargs)
+    return enveloppe
+
+
+class _CountingRandom:
+    """
+    Source aléatoire qui compte ses tirages (utilisée uniquement quand l'instrumentation est active)
+    """
+    def __init__(self, rng, mesures):
+        self._rng = rng
+        self._mesures = mesures
+
+    def randint(self, a, b):
+        self._mesures.count("random_draws")
+        return self._rng.randint(a, b)
+
+    def randrange(self, *args):
+        self._mesures.count("random_draws")
+        return self._rng.randrange(*args)
+
+    def choice(self, seq):
+        self._mesures.count("random_draws")
+        return self._rng.choice(seq)
+
+    def shuffle(self, x):
+        self._mesures.count("random_draws", max(len(x)-1, 0))
+        return self._rng.shuffle(x)
+
+
+def _source(rng):
+    """
+    Source aléatoire d'un générateur : rng, ou l'état global du module random par défaut
+    """
+    rng = rng or _random
+    if _instrumentation is not None and not isinstance(rng, _CountingRandom):
+        return _CountingRandom(rng, _instrumentation)
+    return rng
+
+
+def _complete(etapes):
+    """
+    Exécute d'une traite une construction pas à pas (voir Maze.build_steps)
+    
+    Argument:
+        etapes (generator): générateur d'avancement
+    
+    Retour:
+        valeur renvoyée par le générateur (le labyrinthe)
+    """
+    try:
+        while True:
+            next(etapes)
+    except StopIteration as fin:
+        return fin.value
+
+
+class _NeighborsView(Mapping):
+    """
+    Vue paresseuse (en lecture seule) du voisinage d'un labyrinthe
+    Se comporte comme l'ancien dictionnaire { cellule : ensemble des cellules accessibles }
+    mais chaque ensemble (frozenset) est recalculé à la demande à partir des bits de murs
+    """
+    def __init__(self, maze):
+        self._maze = maze
+
+    def __getitem__(self, c):
+        i, j = c
+        if not (0 <= i < self._maze.height and 0 <= j < self._maze.width):
+            raise KeyError(c)
+        # ensemble figé : une écriture (ancien idiome neighbors[c].add) échoue au lieu d'être perdue
+        return frozenset(self._maze.get_reachable_cells(c))
+
+    def __iter__(self):
+        for i in range(self._maze.height):
+            for j in range(self._maze.width):
+                yield (i, j)
+
+    def __len__(self):
+        return self._maze.height * self._maze.width
+
+    def copy(self):
+        # copie détachée et modifiable, comme l'ancien dictionnaire
+        return {c: set(self[c]) for c in self}
+
+    def __repr__(self):
+        return repr(self.copy())
+
+
+class DisjointSet:
+    """
+    Classe Union-Find (forêt d'ensembles disjoints)
+    Les éléments sont les entiers de 0 à n-1
+    Compression de chemin et union par rang : coût quasi constant par opération
+    """
+    def __init__(self, n):
+        """
+        Constructeur : n singletons {0}, {1}, ..., {n-1}
+        """
+        self.parent = list(range(n))
+        self.rank   = [0] * n
+
+    def find(self, x):
+        """
+        Renvoie le représentant de l'ensemble contenant x
+        
+        Argument:
+            x (int): élément
+        
+        Retour:
+            racine (int): représentant de l'ensemble
+        """
+        parent = self.parent
+        racine = x
+        while parent[racine] != racine:
+            racine = parent[racine]
+        # Compression du chemin
+        while parent[x] != racine:
+            parent[x], x = racine, parent[x]
+        return racine
+
+    def union(self, x, y):
+        """
+        Fusionne les ensembles contenant x et y
+        
+        Arguments:
+            x (int): élément 1
+            y (int): élément 2
+        
+        Retour:
+            (bool): True si une fusion a eu lieu, False si x et y étaient déjà dans le même ensemble
+        """
+        rx, ry = self.find(x), self.find(y)
+        if rx == ry:
+            return False
+        rank = self.rank
+        if rank[rx] < rank[ry]:
+            rx, ry = ry, rx
+        self.parent[ry] = rx
+        if rank[rx] == rank[ry]:
+            rank[rx] += 1
+        return True
+
+
+class _IncrementalTracker:
+    """
+    Suivi incrémental (voir Maze.track) :
+      - composantes connexes : étiquette de chaque cellule et taille de chaque composante
+      - chemin courant de start à stop : liste d'indices et position de chaque cellule dans ce chemin
+    Chaque modification de mur n'explore que la région concernée
+    """
+    def __init__(self, maze, start, stop):
+        self.maze = maze
+        w = maze.width
+        n = maze.height*w
+        self.start, self.stop = start, stop
+        self.s, self.t = start[0]*w + start[1], stop[0]*w + stop[1]
+        self.comp = array('i', [-1]) * n
+        self.taille = {}
+        self.suivant = 0
+        for k in range(n):
+            if self.comp[k] < 0:
+                self.taille[self.suivant] = self._etiqueter(k, self.suivant, -1)
+                self.suivant += 1
+        self._router()
+
+    def _etiqueter(self, k, label, ancien):
+        """
+        Renomme en label les cellules d'étiquette ancien accessibles depuis k
+        Retour: nombre de cellules renommées
+        """
+        comp = self.comp
+        comp[k] = label
+        pile = [k]
+        nb = 1
+        while pile:
+            c = pile.pop()
+            for m in self.maze._reachable_indices(c):
+                if comp[m] == ancien:
+                    comp[m] = label
+                    nb += 1
+                    pile.append(m)
+        return nb
+
+    def _router(self):
+        """
+        Recalcule entièrement le chemin de start à stop (plus court chemin)
+        """
+        self._poser(None)
+        if self.comp[self.s] == self.comp[self.t]:
+            pred = self.maze._traversal(self.start, self.stop)[0]
+            chemin = [self.t]
+            while chemin[-1] != self.s:
+                chemin.append(pred[chemin[-1]])
+            chemin.reverse()
+            self._poser(chemin)
+
+    def _poser(self, chemin):
+        """
+        Installe un nouveau chemin après avoir supprimé ses boucles éventuelles
+        """
+        if chemin is None:
+            self.chemin, self.position = None, {}
+            return
+        propre, position = [], {}
+        for k in chemin:
+            if k in position:
+                for c in propre[position[k]+1:]:
+                    del position[c]
+                del propre[position[k]+1:]
+            else:
+                position[k] = len(propre)
+                propre.append(k)
+        self.chemin, self.position = propre, position
+
+    def _recherche(self, a, b):
+        """
+        Parcours en largeur alternés depuis a et depuis b
+        Retour:
+            (rencontre, predA, predB) si a et b sont encore reliés,
+            (None, cellules, None) sinon, cellules étant la composante épuisée en premier
+        """
+        cotes = ((deque([a]), {a: a}), (deque([b]), {b: b}))
+        while True:
+            for cote in (0, 1):
+                file, pred = cotes[cote]
+                autre = cotes[1-cote][1]
+                if not file:
+                    return None, pred, None
+                k = file.popleft()
+                for m in self.maze._reachable_indices(k):
+                    if m not in pred:
+                        pred[m] = k
+                        if m in autre:
+                            return m, cotes[0][1], cotes[1][1]
+                        file.append(m)
+
+    def wall_removed(self, a, b):
+        """
+        Un passage vient d'être ouvert entre les cellules d'indices a et b
+        """
+        comp = self.comp
+        ca, cb = comp[a], comp[b]
+        if ca != cb:
+            # fusion : la plus petite composante prend l'étiquette de la plus grande
+            if self.taille[ca] > self.taille[cb]:
+                a, b, ca, cb = b, a, cb, ca
+            self._etiqueter(a, cb, ca)
+            self.taille[cb] += self.taille.pop(ca)
+            if self.chemin is None and comp[self.s] == comp[self.t]:
+                self._router()
+        elif self.chemin is not None:
+            # raccourci : si a et b sont sur le chemin, on retire la portion entre les deux
+            pa, pb = self.position.get(a), self.position.get(b)
+            if pa is not None and pb is not None and abs(pa-pb) > 1:
+                if pa > pb:
+                    pa, pb = pb, pa
+                self._poser(self.chemin[:pa+1] + self.chemin[pb:])
+
+    def wall_added(self, a, b):
+        """
+        Le passage entre les cellules d'indices a et b vient d'être fermé
+        """
+        rencontre, predA, predB = self._recherche(a, b)
+        if rencontre is None:
+            # séparation : la composante épuisée reçoit une nouvelle étiquette
+            ancien = self.comp[a]
+            for k in predA:
+                self.comp[k] = self.suivant
+            self.taille[self.suivant] = len(predA)
+            self.taille[ancien] -= len(predA)
+            self.suivant += 1
+            if self.chemin is not None and self.comp[self.s] != self.comp[self.t]:
+                self._poser(None)
+            return
+        if self.chemin is None:
+            return
+        pa, pb = self.position.get(a), self.position.get(b)
+        if pa is None or pb is None or abs(pa-pb) != 1:
+            return
+        # le mur coupe le chemin : on le remplace par le détour de a vers b
+        detour = [rencontre]
+        while detour[-1] != a:
+            detour.append(predA[detour[-1]])
+        detour.reverse()
+        k = rencontre
+        while k != b:
+            k = predB[k]
+            detour.append(k)
+        if pa > pb:
+            detour.reverse()
+            pa, pb = pb, pa
+        self._poser(self.chemin[:pa] + detour + self.chemin[pb+1:])
+
+
+class FlowField:
+    """
+    Champ de directions vers un ensemble de cibles (voir Maze.flow_field)
+    Pour chaque cellule d'indice i*width+j :
+      - dist[k]      : distance à la cible la plus proche, -1 si aucune n'est accessible
+      - direction[k] : direction du prochain pas (0 : nord, 1 : sud, 2 : ouest, 3 : est),
+                       4 sur une cible ou une cellule sans cible accessible
+    Le champ est une photographie : il n'est pas mis à jour si les murs changent
+    """
+    def __init__(self, maze, dist, direction):
+        """
+        Constructeur
+        
+        Arguments:
+            maze (Maze): labyrinthe parcouru
+            dist (array): distance de chaque cellule
+            direction (bytearray): direction du prochain pas de chaque cellule
+        """
+        self.maze      = maze
+        self.dist      = dist
+        self.direction = direction
+
+    def distance(self, c):
+        """
+        Distance de c à la cible la plus proche, -1 si aucune n'est accessible
+        """
+        return self.dist[c[0]*self.maze.width + c[1]]
+
+    def next_step(self, c):
+        """
+        Prochaine cellule d'un agent situé en c, en O(1)
+        
+        Argument:
+            c (tuple): cellule de l'agent
+        
+        Retour:
+            (tuple): cellule suivante, None si c est une cible ou si aucune cible n'est accessible
+        """
+        d = self.direction[c[0]*self.maze.width + c[1]]
+        if d == 4:
+            return None
+        return (c[0] + (-1, 1, 0, 0)[d], c[1] + (0, 0, -1, 1)[d])
+
+    def path(self, c):
+        """
+        Chemin de c à la cible la plus proche, en O(1) par pas
+        
+        Argument:
+            c (tuple): cellule de départ
+        
+        Retour:
+            path (dict): dictionnaire du chemin (même format que solve_bfs, utilisable par overlay),
+                         vide si aucune cible n'est accessible
+        """
+        w = self.maze.width
+        k = c[0]*w + c[1]
+        if self.dist[k] < 0:
+            return {}
+        pas = (-w, w, -1, 1)
+        path = {c: 'D'}
+        while self.direction[k] != 4:
+            k += pas[self.direction[k]]
+            path[divmod(k, w)] = '*'
+        path[divmod(k, w)] = 'A'
+        return path
 
 
 class Maze:
@@ -7,7 +501,10 @@ class Maze:
     Classe Labyrinthe
     Représentation sous forme de graphe non-orienté
     dont chaque sommet est une cellule (un tuple (l,c))
-    et dont la structure est représentée par un dictionnaire
+    La structure est stockée de façon compacte dans deux tableaux de bits :
+      - _east  : bit k à 1 si la cellule k = i*width+j a un mur à l'est
+      - _south : bit k à 1 si la cellule k = i*width+j a un mur au sud
+    L'attribut neighbors reste disponible sous forme de vue
       - clés : sommets
       - valeurs : ensemble des sommets voisins accessibles
     """
@@ -15,12 +512,40 @@ class Maze:
         """
         Constructeur d'un labyrinthe de height cellules de haut 
         et de width cellules de large 
-        Les voisinages sont initialisés à des ensembles vides
+        Tous les bits de murs sont initialisés à 1
         Remarque : dans le labyrinthe créé, chaque cellule est complètement emmurée
         """
         self.height    = height
         self.width     = width
-        self.neighbors = {(i,j): set() for i in range(height) for j in range (width)}
+        self._cells    = None
+        self._suivi    = None
+        self.algorithm = None
+        self.seed      = None
+        self.fill()
+
+    @property
+    def neighbors(self):
+        """
+        Vue de compatibilité : dictionnaire (en lecture seule) des cellules accessibles
+        """
+        return _NeighborsView(self)
+
+    def _wall_bit(self, c1, c2):
+        """
+        Localise le bit codant le mur entre deux cellules contigües
+        
+        Arguments:
+            c1 (tuple): cellule 1
+            c2 (tuple): cellule 2
+            
+        Retour:
+            (bytearray, int): tableau de bits et indice du bit dans ce tableau
+        """
+        if c1[0] == c2[0] and abs(c1[1]-c2[1]) == 1:
+            return self._east, c1[0]*self.width + min(c1[1], c2[1])
+        assert c1[1] == c2[1] and abs(c1[0]-c2[0]) == 1, \
+            f"Erreur : les cellules {c1} et {c2} ne sont pas contigües"
+        return self._south, min(c1[0], c2[0])*self.width + c1[1]
 
     def info(self):
         """
@@ -45,39 +570,92 @@ class Maze:
         txt += "- Structure cohérente\n" if valid else f"- Structure incohérente : {c1} X {c2}\n"
         return txt
 
+    @_instrumented
     def __str__(self):
         """
         Représentation textuelle d'un objet Maze (en utilisant des caractères ascii)
         Retour:
              chaîne (str) : chaîne de caractères représentant le labyrinthe
         """
-        txt = ""
-        # Première ligne
-        txt += "┏"
-        for j in range(self.width-1):
-            txt += "━━━┳"
-        txt += "━━━┓\n"
-        txt += "┃"
-        for j in range(self.width-1):
-            txt += "   ┃" if (0,j+1) not in self.neighbors[(0,j)] else "    "
-        txt += "   ┃\n"
-        # Lignes normales
-        for i in range(self.height-1):
-            txt += "┣"
-            for j in range(self.width-1):
-                txt += "━━━╋" if (i+1,j) not in self.neighbors[(i,j)] else "   ╋"
-            txt += "━━━┫\n" if (i+1,self.width-1) not in self.neighbors[(i,self.width-1)] else "   ┫\n"
-            txt += "┃"
-            for j in range(self.width):
-                txt += "   ┃" if (i+1,j+1) not in self.neighbors[(i+1,j)] else "    "
-            txt += "\n"
-        # Bas du tableau
-        txt += "┗"
-        for i in range(self.width-1):
-            txt += "━━━┻"
-        txt += "━━━┛\n"
-        return txt
+        return self._render()
     
+    def _edge(self, k, d):
+        """
+        Indice du mur de la cellule d'indice k dans la direction d
+        Un mur est repéré par 2*m+s : mur est (s=0) ou sud (s=1) de la cellule d'indice m
+        
+        Arguments:
+            k (int): indice i*width+j de la cellule
+            d (int): direction (0 : nord, 1 : sud, 2 : ouest, 3 : est)
+            
+        Retour:
+            (int): indice du mur (format de add_walls / remove_walls)
+        """
+        return 2*k + (1 - 2*self.width, 1, -2, 0)[d]
+
+    def _inner_edges(self):
+        """
+        Indices de tous les murs intérieurs, dans l'ordre de get_walls
+        
+        Retour:
+            (array): indices 2*k+s des murs est (s=0) et sud (s=1) entre cellules de la grille
+        """
+        w = self.width
+        n = self.height*w
+        return array('l', [2*k + s for k in range(n) for s, ok in ((0, k % w < w-1), (1, k < n-w)) if ok])
+
+    def _edge_indices(self, edges):
+        """
+        Convertit et valide (une seule fois pour tout le lot) une liste de murs
+        
+        Argument:
+            edges (iterable): couples de cellules contigües ((i1,j1),(i2,j2)) ou indices de murs 2*k+s
+        
+        Retour:
+            (array): indices des murs
+        """
+        h, w = self.height, self.width
+        n = h*w
+        if not isinstance(edges, array):
+            edges = list(edges)
+        # indices entiers de tout type (int, numpy.int64...) ou couples de cellules
+        if edges and not isinstance(edges[0], numbers.Integral):
+            assert all(0 <= c[0] < h and 0 <= c[1] < w for mur in edges for c in mur), \
+                f"Erreur lors de la modification des murs : les coordonnées ne sont pas compatibles avec les dimensions du labyrinthe"
+            edges = array('l', [2*(c1[0]*w + min(c1[1], c2[1])) if c1[0] == c2[0] and abs(c1[1]-c2[1]) == 1
+                                else 2*(min(c1[0], c2[0])*w + c1[1]) + 1 if c1[1] == c2[1] and abs(c1[0]-c2[0]) == 1
+                                else -1 for c1, c2 in edges])
+            assert not edges or min(edges) >= 0, "Erreur : les cellules d'un mur doivent être contigües"
+        elif not isinstance(edges, array):
+            edges = array('l', map(int, edges))
+        assert not edges or (min(edges) >= 0 and max(edges) < 2*n
+                             and all(e >> 1 < n-w if e & 1 else (e >> 1) % w < w-1 for e in edges)), \
+            "Erreur : indice de mur hors du labyrinthe (ou sur son bord)"
+        return edges
+
+    @staticmethod
+    def stream_str(rows, width):
+        """
+        Représentation textuelle ligne par ligne d'un labyrinthe donné sous forme de flux
+        La concaténation des lignes produites est identique à str(laby)
+        
+        Arguments:
+            rows (iterable): couples (est, sud) tels que produits par iter_rows ou les méthodes stream_*
+            width (int): largeur du labyrinthe
+            
+        Retour:
+            générateur de chaînes (str), chacune terminée par un retour à la ligne
+        """
+        yield "┏" + "━━━┳"*(width-1) + "━━━┓\n"
+        sudPrec = None
+        for est, sud in rows:
+            if sudPrec is not None:
+                yield "┣" + "".join("━━━╋" if sudPrec[j] else "   ╋" for j in range(width-1)) \
+                    + ("━━━┫\n" if sudPrec[width-1] else "   ┫\n")
+            yield "┃" + "".join("   ┃" if est[j] else "    " for j in range(width-1)) + "   ┃\n"
+            sudPrec = sud
+        yield "┗" + "━━━┻"*(width-1) + "━━━┛\n"
+
     def add_wall(self, c1, c2):
         # Facultatif : on teste si les sommets sont bien dans le labyrinthe
         assert 0 <= c1[0] < self.height and \
@@ -85,11 +663,15 @@ class Maze:
             0 <= c2[0] < self.height and \
             0 <= c2[1] < self.width, \
             f"Erreur lors de l'ajout d'un mur entre {c1} et {c2} : les coordonnées de sont pas compatibles avec les dimensions du labyrinthe"
-        # Ajout du mur
-        if c2 in self.neighbors[c1]:      # Si c2 est dans les voisines de c1
-            self.neighbors[c1].remove(c2) # on le retire
-        if c1 in self.neighbors[c2]:      # Si c3 est dans les voisines de c2
-            self.neighbors[c2].remove(c1) # on le retire
+        # Ajout du mur : on met le bit correspondant à 1
+        bits, k = self._wall_bit(c1, c2)
+        ouvert = not bits[k >> 3] >> (k & 7) & 1
+        bits[k >> 3] |= 1 << (k & 7)
+        self._distance_index = None
+        if _instrumentation is not None:
+            _instrumentation.count("walls_added")
+        if self._suivi is not None and ouvert:
+            self._suivi.wall_added(c1[0]*self.width + c1[1], c2[0]*self.width + c2[1])
     
     def remove_wall(self, c1, c2):
         """
@@ -102,10 +684,75 @@ class Maze:
         Retour:
             Ne retourne rien        
         """
-        if c2 not in self.neighbors[c1]:  # Si c2 est dans les voisines de c1
-            self.neighbors[c1].add(c2) # on le retire
-        if c1 not in self.neighbors[c2]:      # Si c3 n'est pas dans les voisines de c2
-            self.neighbors[c2].add(c1) # on le retire
+        # On teste si les sommets sont bien dans le labyrinthe (sinon un bit de bord serait effacé)
+        assert 0 <= c1[0] < self.height and \
+            0 <= c1[1] < self.width and \
+            0 <= c2[0] < self.height and \
+            0 <= c2[1] < self.width, \
+            f"Erreur lors de la suppression d'un mur entre {c1} et {c2} : les coordonnées ne sont pas compatibles avec les dimensions du labyrinthe"
+        # Suppression du mur : on met le bit correspondant à 0
+        bits, k = self._wall_bit(c1, c2)
+        ferme = bits[k >> 3] >> (k & 7) & 1
+        bits[k >> 3] &= ~(1 << (k & 7)) & 0xFF
+        self._distance_index = None
+        if _instrumentation is not None:
+            _instrumentation.count("walls_removed")
+        if self._suivi is not None and ferme:
+            self._suivi.wall_removed(c1[0]*self.width + c1[1], c2[0]*self.width + c2[1])
+        return None
+
+    def add_walls(self, edges):
+        """
+        Ajoute un lot de murs (la validation est faite une seule fois pour tout le lot)
+        
+        Argument:
+            edges (iterable): couples de cellules contigües ((i1,j1),(i2,j2)) ou indices de murs 2*k+s
+                              (mur est (s=0) ou sud (s=1) de la cellule d'indice k), par exemple un array
+            
+        Retour:
+            Ne retourne rien
+        """
+        edges = self._edge_indices(edges)
+        w = self.width
+        bits = (self._east, self._south)
+        suivi = self._suivi
+        for e in edges:
+            k = e >> 1
+            octets = bits[e & 1]
+            ouvert = not octets[k >> 3] >> (k & 7) & 1
+            octets[k >> 3] |= 1 << (k & 7)
+            if suivi is not None and ouvert:
+                suivi.wall_added(k, k + (w if e & 1 else 1))
+        self._distance_index = None
+        if _instrumentation is not None:
+            _instrumentation.count("walls_added", len(edges))
+        return None
+
+    def remove_walls(self, edges):
+        """
+        Supprime un lot de murs (la validation est faite une seule fois pour tout le lot)
+        
+        Argument:
+            edges (iterable): couples de cellules contigües ((i1,j1),(i2,j2)) ou indices de murs 2*k+s
+                              (mur est (s=0) ou sud (s=1) de la cellule d'indice k), par exemple un array
+            
+        Retour:
+            Ne retourne rien
+        """
+        edges = self._edge_indices(edges)
+        w = self.width
+        bits = (self._east, self._south)
+        suivi = self._suivi
+        for e in edges:
+            k = e >> 1
+            octets = bits[e & 1]
+            ferme = octets[k >> 3] >> (k & 7) & 1
+            octets[k >> 3] &= ~(1 << (k & 7)) & 0xFF
+            if suivi is not None and ferme:
+                suivi.wall_removed(k, k + (w if e & 1 else 1))
+        self._distance_index = None
+        if _instrumentation is not None:
+            _instrumentation.count("walls_removed", len(edges))
         return None
     
     def get_cells(self):
@@ -115,11 +762,10 @@ class Maze:
         Retour:
             L (list) : Liste de tuples (i,j) où i représente la ligne et j la colonne        
         """
-        L = []
-        for i in range (self.height):
-            for j in range (self.width):
-                L.append((i,j))
-        return L
+        # La liste des cellules ne dépend que des dimensions : calculée une seule fois
+        if self._cells is None:
+            self._cells = tuple((i,j) for i in range(self.height) for j in range(self.width))
+        return list(self._cells)
     
     def get_walls(self):
         """
@@ -129,11 +775,16 @@ class Maze:
             L (list) : Liste de tuples de cellules        
         """
         L = []
-        for c in self.get_cells():
-            if (c[0], c[1]+1) in self.get_cells() and (c[0], c[1]+1) not in self.neighbors[c]:
-                L.append(((c[0], c[1]),(c[0], c[1]+1)))
-            if (c[0]+1, c[1]) in self.get_cells() and (c[0]+1, c[1]) not in self.neighbors[c]:
-                L.append(((c[0], c[1]),(c[0]+1, c[1])))
+        h, w = self.height, self.width
+        east, south = self._east, self._south
+        for i in range(h):
+            for j in range(w):
+                k = i*w + j
+                # tests de bornes par arithmétique, puis lecture directe des bits
+                if j+1 < w and east[k >> 3] >> (k & 7) & 1:
+                    L.append(((i, j),(i, j+1)))
+                if i+1 < h and south[k >> 3] >> (k & 7) & 1:
+                    L.append(((i, j),(i+1, j)))
         return L
     
     def fill(self):
@@ -143,7 +794,12 @@ class Maze:
         Retour:
             Ne retourne rien        
         """
-        self.neighbors = {(i,j): set() for i in range(self.height) for j in range (self.width)}
+        nbytes = (self.height*self.width + 7) // 8
+        self._east  = bytearray(b'\xff') * nbytes
+        self._south = bytearray(b'\xff') * nbytes
+        self._distance_index = None
+        if self._suivi is not None:
+            self.track(self._suivi.start, self._suivi.stop)
         return None
     
     def empty(self):
@@ -153,12 +809,7 @@ class Maze:
         Retour:
             Ne retourne rien
         """
-        for i in range(self.height):
-            for j in range(self.width):
-                if j+1 < self.height:
-                    self.remove_wall((i,j), (i,j+1))
-                if i+1 < self.height:
-                    self.remove_wall((i,j), (i+1,j))
+        self.remove_walls(self._inner_edges())
         return None
         
     def get_contiguous_cells(self, c):
@@ -193,127 +844,529 @@ class Maze:
         Retour:
             Liste de cellules        
         """
-        return [cell for cell in self.neighbors[c]]
+        i, j = c
+        w = self.width
+        k = i*w + j
+        east, south = self._east, self._south
+        lst = []
+        if i > 0 and not south[(k-w) >> 3] >> ((k-w) & 7) & 1:
+            lst.append((i-1, j))
+        if i < self.height-1 and not south[k >> 3] >> (k & 7) & 1:
+            lst.append((i+1, j))
+        if j > 0 and not east[(k-1) >> 3] >> ((k-1) & 7) & 1:
+            lst.append((i, j-1))
+        if j < w-1 and not east[k >> 3] >> (k & 7) & 1:
+            lst.append((i, j+1))
+        return lst
       
+    def to_bytes(self):
+        """
+        Sérialisation dans le format binaire versionné :
+          - en-tête (FORMAT_ENTETE) : signature, version, drapeaux, algorithme,
+            graine sous la forme lot * 2**32 + indice (lot signé sur 64 bits, indice sur 32 bits,
+            voir generate_batch), hauteur, largeur
+          - bits de murs à l'est puis au sud (2 bits par cellule)
+        
+        Retour:
+            (bytes): labyrinthe sérialisé
+        """
+        drapeaux = 0 if self.seed is None else 1
+        lot, indice = divmod(self.seed or 0, 2**32)
+        assert -2**63 <= lot < 2**63, f"Erreur : la graine {self.seed} n'est pas représentable"
+        entete = struct.pack(FORMAT_ENTETE, FORMAT_SIGNATURE, FORMAT_VERSION, drapeaux,
+                             (self.algorithm or "").encode("ascii"),
+                             lot, indice, self.height, self.width)
+        return entete + bytes(self._east) + bytes(self._south)
+
     @classmethod
-    def gen_btree(cls, h, w):
+    def from_bytes(cls, data, copy=True):
         """
-        Génère un labyrinthe à h lignes et w colonnes à partir d'un arbre binaire
+        Reconstruit un labyrinthe sérialisé par to_bytes
         
         Arguments:
             cls: classe à laquelle cette méthode appartient
-            h (int): hauteur du labyrinthe
-            w (int): largeur du labyrinthe
+            data (bytes): labyrinthe sérialisé (bytes, bytearray, memoryview, mmap...)
+            copy (bool): si False, les tableaux de murs sont des vues sur data (aucune copie)
             
         Retour:
             laby (Maze): instance de classe du labyrinthe
         """
-        laby = Maze(h,w)
-        for cell in laby.neighbors:
-            if cell[0] < laby.height-1 and cell[1] < laby.width-1:
-                temp = randint(0,1)
-                if temp == 0:
-                    laby.remove_wall(cell,(cell[0]+1,cell[1]))
-                if temp == 1:
-                    laby.remove_wall(cell,(cell[0],cell[1]+1))
-            elif cell[0] < laby.height-1:
-                laby.remove_wall(cell,(cell[0]+1,cell[1]))   
-            elif cell[1] < laby.width-1:
-                laby.remove_wall(cell,(cell[0],cell[1]+1))
+        data = memoryview(data)
+        signature, version, drapeaux, algorithme, lot, indice, h, w = struct.unpack_from(FORMAT_ENTETE, data)
+        assert signature == FORMAT_SIGNATURE, "Erreur : ce n'est pas un labyrinthe sérialisé"
+        assert version == FORMAT_VERSION, f"Erreur : version de format {version} non prise en charge"
+        graine = lot * 2**32 + indice
+        nbytes = (h*w + 7) // 8
+        debut = struct.calcsize(FORMAT_ENTETE)
+        assert len(data) >= debut + 2*nbytes, "Erreur : données de murs tronquées"
+        # labyrinthe vide dont les tableaux de murs sont remplacés ci-dessous
+        laby = cls(0, 0)
+        laby.height, laby.width = h, w
+        laby.algorithm = algorithme.rstrip(b"\0").decode("ascii") or None
+        laby.seed = graine if drapeaux & 1 else None
+        east, south = data[debut:debut+nbytes], data[debut+nbytes:debut+2*nbytes]
+        laby._east, laby._south = (bytearray(east), bytearray(south)) if copy else (east, south)
         return laby
-    
+
+    def save(self, path):
+        """
+        Enregistre le labyrinthe dans un fichier au format binaire (voir to_bytes)
+        
+        Argument:
+            path (str): chemin du fichier
+            
+        Retour:
+            Ne retourne rien
+        """
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+        return None
+
     @classmethod
-    def gen_sidewinder(cls, h, w):
+    def load(cls, path, mmap=True):
         """
-        Génère un labyrinthe à h lignes et w colonnes en utilisant l'algorithme de construction sidewinder
+        Charge un labyrinthe enregistré par save
         
         Arguments:
             cls: classe à laquelle cette méthode appartient
-            h (int): hauteur du labyrinthe
-            w (int): largeur du labyrinthe
+            path (str): chemin du fichier
+            mmap (bool): projette le fichier en mémoire sans le copier ; les murs sont lus
+                         à la demande et les modifications restent locales (copie sur écriture)
             
         Retour:
-            labySW (Maze): instance de classe du labyrinthe
+            laby (Maze): instance de classe du labyrinthe
         """
-        labySW = Maze(h, w)
-    
-        for i in range(0, h-1):
-            seq = []
-        
-            for j in range (0, w-1):
-                seq.append((i,j))
-                res = randint(0,1)
-                if res == 0:
-                    labySW.remove_wall((i,j), (i,j+1))
-                if res == 1:
-                    cell = randint(0, len(seq)-1)
-                    labySW.remove_wall(seq[cell], (seq[cell][0]+1,seq[cell][1]))
-                    seq = []
-                
-            seq.append((i,j))
-            cell = randint(0, len(seq)-1)
-            labySW.remove_wall(seq[cell], (seq[cell][0]+1,seq[cell][1]))
-        
-        for k in range(0, w-1):
-            labySW.remove_wall((h-1,k), (h-1,k+1))
-    
-        return labySW
-    
+        with open(path, "rb") as f:
+            if not mmap:
+                return cls.from_bytes(f.read())
+            projection = _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_COPY)
+        return cls.from_bytes(projection, copy=False)
+
     @classmethod
-    def gen_fusion(cls, h, w):
+    def build_steps(cls, algorithm, h, w, rng=None):
         """
-        Génère un labyrinthe à h lignes et w colonnes avec l'algorithme de fusion de chemin
+        Construction pas à pas d'un labyrinthe, pour une interface qui ne doit pas se figer :
+        le générateur rend la main régulièrement en produisant l'avancement
+            etapes = Maze.build_steps("wilson", 500, 500)
+            try:
+                while True:
+                    progres = next(etapes)   # afficher la progression, laisser la boucle d'événements tourner...
+            except StopIteration as fin:
+                laby = fin.value
         
         Arguments:
             cls: classe à laquelle cette méthode appartient
+            algorithm (str): nom du générateur ("btree", "sidewinder", "fusion", "exploration", "wilson")
             h (int): hauteur du labyrinthe
             w (int): largeur du labyrinthe
+            rng (Random): source aléatoire (par défaut : l'état global du module random)
+            
+        Retour:
+            générateur de l'avancement (float entre 0 et 1), renvoyant le labyrinthe
+        """
+        assert hasattr(cls, "gen_" + algorithm), f"Erreur : générateur inconnu {algorithm}"
+        rng = _source(rng)
+        if algorithm in ("btree", "sidewinder"):
+            laby = yield from cls._build_rows(h, w, getattr(cls, "stream_" + algorithm)(h, w, rng))
+            laby.algorithm = algorithm
+            return laby
+        return (yield from getattr(cls, "_build_" + algorithm)(h, w, rng))
+
+    @classmethod
+    def generate_batch(cls, algorithm, h, w, count, seed, workers=None):
+        """
+        Génère un lot de labyrinthes reproductibles, répartis sur un groupe de processus
+        Le i-ème labyrinthe utilise sa propre source Random(seed * 2**32 + i) :
+        le résultat ne dépend pas du nombre de processus
         
+        Arguments:
+            cls: classe à laquelle cette méthode appartient
+            algorithm (str): nom du générateur ("btree", "sidewinder", "fusion", "exploration", "wilson")
+            h (int): hauteur des labyrinthes
+            w (int): largeur des labyrinthes
+            count (int): nombre de labyrinthes
+            seed (int): graine du lot (entier signé sur 64 bits)
+            workers (int): nombre de processus (None : nombre de processeurs, 1 : dans le processus courant)
+            
         Retour:
-            laby (Maze): instance de classe du labyrinthe
+            (list): labyrinthes sérialisés (voir to_bytes / from_bytes), dans l'ordre des graines,
+                    chacun portant son algorithme et sa graine
         """
-        laby = Maze(h, w)
-        # label
-        label = laby.neighbors.copy()
-        a = 0
-        for cell in label:
-            label[cell] = a
-            a += 1
-        # liste de tous les murs
-        lstMur = laby.get_walls()
-        shuffle(lstMur)
-        # creer laby
-        for mur in lstMur:
-            if label[mur[0]] != label[mur[1]]:
-                laby.remove_wall(mur[0],mur[1])        
-                old = label[mur[1]]
-                new = label[mur[0]]
-                for cell in label:
-                    if label[cell] == old:
-                        label[cell] = new
-        return laby
-    
+        assert hasattr(cls, "gen_" + algorithm), f"Erreur : générateur inconnu {algorithm}"
+        # la graine du lot et l'indice sont sérialisés séparément (voir to_bytes)
+        assert -2**63 <= seed < 2**63 and count <= 2**32, \
+            f"Erreur : graine de lot {seed} (ou nombre de labyrinthes {count}) non représentable"
+        graines = [seed * 2**32 + i for i in range(count)]
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            return _generate_jobs(algorithm, h, w, graines)
+        # quelques lots par processus pour équilibrer la charge
+        taille = max(1, count // (4 * workers))
+        lots = [graines[i:i+taille] for i in range(0, count, taille)]
+        # import local : concurrent.futures.process nécessite _multiprocessing, absent du navigateur (Pyodide)
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(workers) as pool:
+            resultats = pool.map(_generate_jobs, [algorithm]*len(lots), [h]*len(lots), [w]*len(lots), lots)
+            return [laby for lot in resultats for laby in lot]
+
+    def iter_rows(self):
+        """
+        Parcourt le labyrinthe ligne par ligne sous forme de bits de murs
+        (même format que les générateurs en flux stream_*)
+        
+        Retour:
+            générateur de couples (est, sud) de bytearray de longueur width :
+            est[j] (resp. sud[j]) vaut 1 si la cellule (i,j) a un mur à l'est (resp. au sud)
+        """
+        w = self.width
+        east, south = self._east, self._south
+        for i in range(self.height):
+            est, sud = bytearray(w), bytearray(w)
+            for j in range(w):
+                k = i*w + j
+                est[j] = east[k >> 3] >> (k & 7) & 1
+                sud[j] = south[k >> 3] >> (k & 7) & 1
+            yield est, sud
+
     @classmethod
-    def gen_exploration(cls, h, w):
+    def from_rows(cls, h, w, rows):
         """
-        Génère un labyrinthe à h lignes et w colonnes en utilisant l'algorithme de génération par exploration
+        Construit un labyrinthe à partir d'un flux de lignes de bits de murs
         
         Arguments:
             cls: classe à laquelle cette méthode appartient
             h (int): hauteur du labyrinthe
             w (int): largeur du labyrinthe
+            rows (iterable): couples (est, sud) tels que produits par les méthodes stream_*
             
         Retour:
-            labyExp (Maze): instance de classe du labyrinthe
+            laby (Maze): instance de classe du labyrinthe
         """
-        # Création du labyrinthe
-        labyExp = Maze(h,w)
-        labyExp.fill()
+        return _complete(cls._build_rows(h, w, rows))
 
-        # Initialisation
-        lst_cells = labyExp.get_cells()
-        rand_cell = lst_cells[randint(0,len(lst_cells)-1)]
-        visite = [rand_cell]
+    @classmethod
+    def _build_rows(cls, h, w, rows):
+        """
+        Version pas à pas de from_rows : l'avancement est produit après chaque ligne
+        
+        Arguments:
+            cls: classe à laquelle cette méthode appartient
+            h (int): hauteur du labyrinthe
+            w (int): largeur du labyrinthe
+            rows (iterable): couples (est, sud) tels que produits par les méthodes stream_*
+            
+        Retour:
+            générateur de l'avancement (float entre 0 et 1), renvoyant le labyrinthe
+        """
+        laby = cls(h, w)
+        for i, (est, sud) in enumerate(rows):
+            k = 2*i*w
+            ouverts = array('l', [k + 2*j for j in range(w) if not est[j]])
+            ouverts.extend([k + 2*j + 1 for j in range(w) if not sud[j]])
+            laby.remove_walls(ouverts)
+            yield (i+1) / h
+        return laby
+
+    @staticmethod
+    def stream_btree(h, w, rng=None):
+        """
+        Génère, ligne par ligne, un labyrinthe à h lignes et w colonnes à partir d'un arbre binaire
+        Mémoire en O(w) : seule la ligne courante est conservée
+        
+        Arguments:
+            h (int): hauteur du labyrinthe
+            w (int): largeur du labyrinthe
+            rng (Random): source aléatoire (par défaut : l'état global du module random)
+            
+        Retour:
+            générateur de couples (est, sud) de bytearray (1 : mur, 0 : passage)
+        """
+        rng = _source(rng)
+        for i in range(h):
+            est, sud = bytearray(b'\x01')*w, bytearray(b'\x01')*w
+            for j in range(w):
+                if i < h-1 and j < w-1:
+                    if rng.randint(0,1) == 0:
+                        sud[j] = 0
+                    else:
+                        est[j] = 0
+                elif i < h-1:
+                    sud[j] = 0
+                elif j < w-1:
+                    est[j] = 0
+            yield est, sud
+
+    @classmethod
+    @_instrumented
+    def gen_btree(cls, h, w, rng=None):
+        """
+        Génère un labyrinthe à h lignes et w colonnes à partir d'un arbre binaire
+        
+        Arguments:
+            cls: classe à laquelle cette méthode appartient
+            h (int): hauteur du labyrinthe
+            w (int): largeur du labyrinthe
+            rng (Random): source aléatoire (par défaut : l'état global du module random)
+            
+        Retour:
+            laby (Maze): instance de classe du labyrinthe
+        """
+        laby = cls.from_rows(h, w, cls.stream_btree(h, w, rng))
+        laby.algorithm = "btree"
+        return laby
+
+    @staticmethod
+    def stream_sidewinder(h, w, rng=None):
+        """
+        Génère, ligne par ligne, un labyrinthe à h lignes et w colonnes
+        avec l'algorithme de construction sidewinder
+        Mémoire en O(w) : seule la ligne courante est conservée
+        
+        Arguments:
+            h (int): hauteur du labyrinthe
+            w (int): largeur du labyrinthe
+            rng (Random): source aléatoire (par défaut : l'état global du module random)
+            
+        Retour:
+            générateur de couples (est, sud) de bytearray (1 : mur, 0 : passage)
+        """
+        rng = _source(rng)
+        for i in range(h-1):
+            est, sud = bytearray(b'\x01')*w, bytearray(b'\x01')*w
+            debut = 0
+            for j in range(w):
+                # on prolonge la séquence vers l'est, ou on la ferme en creusant vers le sud
+                if j < w-1 and rng.randint(0,1) == 0:
+                    est[j] = 0
+                else:
+                    sud[rng.randint(debut, j)] = 0
+                    debut = j+1
+            yield est, sud
+        # Dernière ligne : un seul couloir
+        est = bytearray(w)
+        est[w-1] = 1
+        yield est, bytearray(b'\x01')*w
+
+    @classmethod
+    @_instrumented
+    def gen_sidewinder(cls, h, w, rng=None):
+        """
+        Génère un labyrinthe à h lignes et w colonnes en utilisant l'algorithme de construction sidewinder
+        
+        Arguments:
+            cls: classe à laquelle cette méthode appartient
+            h (int): hauteur du labyrinthe
+            w (int): largeur du labyrinthe
+            rng (Random): source aléatoire (par défaut : l'état global du module random)
+            
+        Retour:
+            labySW (Maze): instance de classe du labyrinthe
+        """
+        labySW = cls.from_rows(h, w, cls.stream_sidewinder(h, w, rng))
+        labySW.algorithm = "sidewinder"
+        return labySW
+
+    @staticmethod
+    def stream_eller(h, w, rng=None):
+        """
+        Génère, ligne par ligne, un labyrinthe parfait à h lignes et w colonnes
+        avec l'algorithme d'Eller
+        Mémoire en O(w) : seuls les ensembles de la ligne courante sont conservés
+        
+        Arguments:
+            h (int): hauteur du labyrinthe
+            w (int): largeur du labyrinthe
+            rng (Random): source aléatoire (par défaut : l'état global du module random)
+            
+        Retour:
+            générateur de couples (est, sud) de bytearray (1 : mur, 0 : passage)
+        """
+        rng = _source(rng)
+        label = list(range(w))
+        membres = {j: [j] for j in range(w)}
+        suivant = w
+        for i in range(h):
+            derniere = i == h-1
+            est, sud = bytearray(b'\x01')*w, bytearray(b'\x01')*w
+            # Fusions horizontales (obligatoires sur la dernière ligne)
+            for j in range(w-1):
+                a, b = label[j], label[j+1]
+                if a != b and (derniere or rng.randint(0,1) == 0):
+                    est[j] = 0
+                    if len(membres[a]) < len(membres[b]):
+                        a, b = b, a
+                    for c in membres[b]:
+                        label[c] = a
+                    membres[a].extend(membres.pop(b))
+            if derniere:
+                yield est, sud
+                break
+            # Au moins une ouverture vers le sud par ensemble
+            nouveau = {}
+            for a, cols in membres.items():
+                ouvertes = [c for c in cols if rng.randint(0,1) == 0]
+                if not ouvertes:
+                    ouvertes = [cols[rng.randint(0, len(cols)-1)]]
+                for c in ouvertes:
+                    sud[c] = 0
+                nouveau[a] = ouvertes
+            # Les cellules sans ouverture au nord forment de nouveaux ensembles
+            for j in range(w):
+                if sud[j]:
+                    label[j] = suivant
+                    nouveau[suivant] = [j]
+                    suivant += 1
+            membres = nouveau
+            yield est, sud
+
+    @classmethod
+    @_instrumented
+    def gen_fusion(cls, h, w, rng=None):
+        """
+        Génère un labyrinthe à h lignes et w colonnes avec l'algorithme de fusion de chemin
+        
+        Arguments:
+            cls: classe à laquelle cette méthode appartient
+            h (int): hauteur du labyrinthe
+            w (int): largeur du labyrinthe
+            rng (Random): source aléatoire (par défaut : l'état global du module random)
+        
+        Retour:
+            laby (Maze): instance de classe du labyrinthe
+        """
+        return _complete(cls._build_fusion(h, w, _source(rng)))
+
+    @classmethod
+    def _build_fusion(cls, h, w, rng):
+        """
+        Version pas à pas de gen_fusion (voir build_steps)
+        
+        Arguments:
+            cls: classe à laquelle cette méthode appartient
+            h (int): hauteur du labyrinthe
+            w (int): largeur du labyrinthe
+            rng (Random): source aléatoire
+        
+        Retour:
+            générateur de l'avancement (float entre 0 et 1), renvoyant le labyrinthe
+        """
+        laby = Maze(h, w)
+        # une classe par cellule (indice i*w+j)
+        classes = DisjointSet(h*w)
+        # liste de tous les murs (indices 2*k+s, dans l'ordre de get_walls)
+        lstMur = laby._inner_edges()
+        yield 0.0
+        rng.shuffle(lstMur)
+        # creer laby : murs à ouvrir, supprimés en un seul lot
+        ouverts = array('l')
+        for z, mur in enumerate(lstMur):
+            k = mur >> 1
+            if classes.union(k, k + (w if mur & 1 else 1)):
+                ouverts.append(mur)
+            if not z & 0x3FFF:
+                yield z / len(lstMur)
+        laby.remove_walls(ouverts)
+        laby.algorithm = "fusion"
+        return laby
+    
+    @classmethod
+    @_instrumented
+    def gen_exploration(cls, h, w, rng=None, reference=False):
+        """
+        Génère un labyrinthe à h lignes et w colonnes en utilisant l'algorithme de génération par exploration
+        (parcours en profondeur itératif, sans récursion)
+        
+        Arguments:
+            cls: classe à laquelle cette méthode appartient
+            h (int): hauteur du labyrinthe
+            w (int): largeur du labyrinthe
+            rng (Random): source aléatoire (par défaut : l'état global du module random)
+            reference (bool): utilise l'implémentation de référence (cellules sous forme de tuples) ;
+                              pour une même source aléatoire, les deux modes produisent le même labyrinthe
+            
+        Retour:
+            labyExp (Maze): instance de classe du labyrinthe
+        """
+        rng = _source(rng)
+        if reference:
+            return cls._gen_exploration_reference(h, w, rng)
+        return _complete(cls._build_exploration(h, w, rng))
+
+    @classmethod
+    def _build_exploration(cls, h, w, rng):
+        """
+        Version pas à pas de gen_exploration (voir build_steps)
+        
+        Arguments:
+            cls: classe à laquelle cette méthode appartient
+            h (int): hauteur du labyrinthe
+            w (int): largeur du labyrinthe
+            rng (Random): source aléatoire
+        
+        Retour:
+            générateur de l'avancement (float entre 0 et 1), renvoyant le labyrinthe
+        """
+        labyExp = Maze(h,w)
+        n = h*w
+        # Décalages d'indice vers les cellules contigües (nord, sud, ouest, est)
+        pas = (-w, w, -1, 1)
+        # cellules visitées : un octet par cellule d'indice i*w+j ; pile d'indices entiers
+        visite = bytearray(n)
+        k = rng.randrange(n)
+        visite[k] = 1
+        pile = array('i', [k])
+        nb = 1
+        # murs à ouvrir, supprimés en un seul lot
+        ouverts = array('l')
+        while pile:
+            k = pile[-1]
+            j = k % w
+            candidats = []
+            if k >= w and not visite[k-w]:
+                candidats.append(0)
+            if k < n-w and not visite[k+w]:
+                candidats.append(1)
+            if j > 0 and not visite[k-1]:
+                candidats.append(2)
+            if j < w-1 and not visite[k+1]:
+                candidats.append(3)
+            if candidats:
+                d = candidats[rng.randrange(len(candidats))]
+                ouverts.append(labyExp._edge(k, d))
+                k += pas[d]
+                visite[k] = 1
+                pile.append(k)
+                nb += 1
+                if not nb & 0x3FFF:
+                    yield nb / n
+            else:
+                pile.pop()
+        labyExp.remove_walls(ouverts)
+        labyExp.algorithm = "exploration"
+        return labyExp
+
+    @classmethod
+    def _gen_exploration_reference(cls, h, w, rng):
+        """
+        Implémentation de référence de gen_exploration (cellules sous forme de tuples)
+        
+        Arguments:
+            cls: classe à laquelle cette méthode appartient
+            h (int): hauteur du labyrinthe
+            w (int): largeur du labyrinthe
+            rng (Random): source aléatoire
+            
+        Retour:
+            labyExp (Maze): instance de classe du labyrinthe
+        """
+        # Création du labyrinthe
+        labyExp = Maze(h,w)
+
+        # Initialisation
+        rand_cell = divmod(rng.randint(0, h*w-1), w)
+        # cellules visitées : un octet par cellule d'indice i*w+j
+        visite = bytearray(h*w)
+        visite[rand_cell[0]*w + rand_cell[1]] = 1
         pile = [rand_cell]
 
         while pile:
@@ -323,20 +1376,22 @@ class Maze:
             
             #Liste les cellules voisines
             for cell in contiguous_cells:            
-                if cell not in visite:
+                if not visite[cell[0]*w + cell[1]]:
                     contiguous_cells_not_visited.append(cell)
             
             if contiguous_cells_not_visited:
                 pile.append(top)
-                rand_contig_cell_not_visited = contiguous_cells_not_visited[randint(0, len(contiguous_cells_not_visited)-1)]
+                rand_contig_cell_not_visited = contiguous_cells_not_visited[rng.randint(0, len(contiguous_cells_not_visited)-1)]
                 labyExp.remove_wall(rand_contig_cell_not_visited, top)
-                visite.append(rand_contig_cell_not_visited)
+                visite[rand_contig_cell_not_visited[0]*w + rand_contig_cell_not_visited[1]] = 1
                 pile.append(rand_contig_cell_not_visited)
 
+        labyExp.algorithm = "exploration"
         return labyExp
     
     @classmethod
-    def gen_wilson(cls, h, w):
+    @_instrumented
+    def gen_wilson(cls, h, w, rng=None):
         """
         Génère un labyrinthe à h lignes et w colonnes en utilisant l'algorithme de Wilson
         
@@ -344,51 +1399,143 @@ class Maze:
             cls: classe à laquelle cette méthode appartient
             h (int): hauteur du labyrinthe
             w (int): largeur du labyrinthe
+            rng (Random): source aléatoire (par défaut : l'état global du module random)
         
         Retour:
             laby (Maze): instance de classe du labyrinthe
         """
+        return _complete(cls._build_wilson(h, w, _source(rng)))
+
+    @classmethod
+    def _build_wilson(cls, h, w, rng):
+        """
+        Version pas à pas de gen_wilson (voir build_steps)
+        
+        Arguments:
+            cls: classe à laquelle cette méthode appartient
+            h (int): hauteur du labyrinthe
+            w (int): largeur du labyrinthe
+            rng (Random): source aléatoire
+        
+        Retour:
+            générateur de l'avancement (float entre 0 et 1), renvoyant le labyrinthe
+        """
         laby = Maze(h, w)
+        n = h*w
+        pas = (-w, w, -1, 1)
+        # Ensemble indexable des cellules non marquées (suppression par échange avec la dernière)
+        nonMarque = list(range(n))
+        position = list(range(n))
+        marquage = bytearray(n)
+        def marquer(k):
+            marquage[k] = 1
+            dernier = nonMarque.pop()
+            if dernier != k:
+                nonMarque[position[k]] = dernier
+                position[dernier] = position[k]
         # Choisir une cellule au hasard sur la grille et la marquer
-        marquage = {i : False for i in laby.get_cells()}
-        cell = choice(laby.get_cells())
-        marquage[cell] = True
+        marquer(rng.randrange(n))
+        # Dernière direction de sortie de chaque cellule lors de la marche
+        sortie = bytearray(n)
+        etapes = 0
+        # murs à ouvrir, supprimés en un seul lot
+        ouverts = array('l')
         # Tant qu’il reste des cellules non marquées : 
-        cellulesMarque = False
-        while cellulesMarque == False:
-            cellulesMarque = True
-            for i in marquage:
-                if marquage[i] == False:
-                    cellulesMarque = False
+        while nonMarque:
             # Choisir une cellule de départ au hasard, parmi les cellules non marquées
-            cellNonMarque = []
-            for i in marquage:
-                if marquage[i] == False:
-                    cellNonMarque.append(i)
-            if cellNonMarque != []:
-                nextCell = choice(cellNonMarque)
+            depart = nonMarque[rng.randrange(len(nonMarque))]
             # Effectuer une marche aléatoire jusqu’à ce qu’une cellule marquée soit atteinte
-            marche = []
-            while marquage[nextCell] == False:
-                marche.append(nextCell)
-                nextCell = choice(laby.get_contiguous_cells(nextCell))
-                # en cas de boucle «couper» la boucle formée
-                if nextCell in marche:
-                    new = []
-                    i = 0
-                    while marche[i] != nextCell:
-                        new.append(marche[i])
-                        i+=1
-                    marche = new
-            marche.append(nextCell)
-            # Marquer chaque cellule du chemin
-            for i in marche:
-                marquage[i] = True
-            #  casser tous les murs rencontrés
-            for z in range(len(marche)-1):
-                    laby.remove_wall(marche[z],marche[z+1])
+            # seule la dernière sortie de chaque cellule est retenue : les boucles sont «coupées» implicitement
+            k = depart
+            while not marquage[k]:
+                while True:
+                    d = rng.randrange(4)
+                    if (d == 0 and k >= w) or (d == 1 and k < n-w) \
+                       or (d == 2 and k % w) or (d == 3 and k % w != w-1):
+                        break
+                sortie[k] = d
+                k += pas[d]
+                etapes += 1
+                if not etapes & 0xFFFF:
+                    yield 1 - len(nonMarque) / n
+            # Marquer chaque cellule du chemin et casser les murs rencontrés
+            k = depart
+            while not marquage[k]:
+                marquer(k)
+                ouverts.append(laby._edge(k, sortie[k]))
+                k += pas[sortie[k]]
+        laby.remove_walls(ouverts)
+        laby.algorithm = "wilson"
         return laby
+
+    @_instrumented
+    def braid(self, density=1.0, rng=None, method="dead_ends"):
+        """
+        Tresse le labyrinthe : ouvre des murs supplémentaires pour créer des boucles
+          - "dead_ends" : supprime une proportion density des culs-de-sac en ouvrant un mur de chacun,
+            de préférence vers un autre cul-de-sac (ce qui en supprime deux d'un coup)
+          - "random" : ouvre une proportion density des murs intérieurs encore fermés, tirés au hasard
+        La grille n'est parcourue qu'une fois ; les degrés sont ensuite tenus à jour à chaque ouverture
+        Le labyrinthe n'est plus parfait : les solveurs en largeur, A* et bidirectionnel renvoient
+        un plus court chemin parmi plusieurs possibles
+        
+        Arguments:
+            density (float): proportion entre 0 et 1 de culs-de-sac supprimés (resp. de murs ouverts)
+            rng (Random): source aléatoire (par défaut : l'état global du module random)
+            method (str): "dead_ends" ou "random"
+        
+        Retour:
+            (int): nombre de murs ouverts (chacun crée une boucle dans un labyrinthe connexe)
+        """
+        assert 0 <= density <= 1, f"Erreur : densité {density} hors de [0, 1]"
+        assert method in ("dead_ends", "random"), f"Erreur : méthode de tressage inconnue {method}"
+        rng = _source(rng)
+        h, w = self.height, self.width
+        n = h*w
+        east, south = self._east, self._south
+        ouverts = 0
+        if method == "random":
+            murs = [k << 1 | sens for k in range(n)
+                    for sens, bits, ok in ((0, east, k % w < w-1), (1, south, k < n-w))
+                    if ok and bits[k >> 3] >> (k & 7) & 1]
+            # tirage sans remise : mélange partiel des nb premiers murs
+            nb = round(density*len(murs))
+            for z in range(nb):
+                r = rng.randrange(z, len(murs))
+                murs[z], murs[r] = murs[r], murs[z]
+            self.remove_walls(murs[:nb])
+            return nb
+        deg = self._degrees()
+        # murs à ouvrir, supprimés en un seul lot : un cul-de-sac dont un mur est en attente
+        # n'est plus de degré 1, ses murs ne sont donc plus consultés
+        murs = []
+        culs = [k for k in range(n) if deg[k] == 1]
+        rng.shuffle(culs)
+        restants = len(culs)
+        cible = restants - round(density*restants)
+        for k in culs:
+            if restants <= cible:
+                break
+            if deg[k] != 1:
+                # déjà relié par l'ouverture d'un cul-de-sac voisin
+                continue
+            j = k % w
+            fermes = [m for m, ok in ((k-w, k >= w and south[(k-w) >> 3] >> ((k-w) & 7) & 1),
+                                      (k+w, k < n-w and south[k >> 3] >> (k & 7) & 1),
+                                      (k-1, j > 0 and east[(k-1) >> 3] >> ((k-1) & 7) & 1),
+                                      (k+1, j < w-1 and east[k >> 3] >> (k & 7) & 1)) if ok]
+            if not fermes:
+                continue
+            m = rng.choice([m for m in fermes if deg[m] == 1] or fermes)
+            murs.append((divmod(k, w), divmod(m, w)))
+            restants -= 2 if deg[m] == 1 else 1
+            deg[k] += 1
+            deg[m] += 1
+            ouverts += 1
+        self.remove_walls(murs)
+        return ouverts
     
+    @_instrumented
     def overlay(self, content=None):
         """
         Rendu en mode texte, sur la sortie standard, \
@@ -398,93 +1545,274 @@ class Maze:
         Retour:
             string
         """
-        if content is None:
-            content = {(i,j):' ' for i in range(self.height) for j in range(self.width)}
-        else:
-            # Python >=3.9
-            #content = content | {(i, j): ' ' for i in range(
-            #    self.height) for j in range(self.width) if (i,j) not in content}
-            # Python <3.9
-            new_content = {(i, j): ' ' for i in range(self.height) for j in range(self.width) if (i,j) not in content}
-            content = {**content, **new_content}
-        txt = r""
-        # Première ligne
-        txt += "┏"
-        for j in range(self.width-1):
-            txt += "━━━┳"
-        txt += "━━━┓\n"
-        txt += "┃"
-        for j in range(self.width-1):
-            txt += " "+content[(0,j)]+" ┃" if (0,j+1) not in self.neighbors[(0,j)] else " "+content[(0,j)]+"  "
-        txt += " "+content[(0,self.width-1)]+" ┃\n"
-        # Lignes normales
-        for i in range(self.height-1):
-            txt += "┣"
-            for j in range(self.width-1):
-                txt += "━━━╋" if (i+1,j) not in self.neighbors[(i,j)] else "   ╋"
-            txt += "━━━┫\n" if (i+1,self.width-1) not in self.neighbors[(i,self.width-1)] else "   ┫\n"
-            txt += "┃"
-            for j in range(self.width):
-                txt += " "+content[(i+1,j)]+" ┃" if (i+1,j+1) not in self.neighbors[(i+1,j)] else " "+content[(i+1,j)]+"  "
-            txt += "\n"
-        # Bas du tableau
-        txt += "┗"
-        for i in range(self.width-1):
-            txt += "━━━┻"
-        txt += "━━━┛\n"
-        return txt
+        return self._render(content)
+
+    def _render(self, content=None):
+        """
+        Moteur de rendu texte commun à __str__ et overlay
+        Chaque ligne est assemblée avec str.join à partir de tables de segments
+        indexées directement par les bits de murs
+        
+        Argument:
+            content (dict) : contenu (creux) des cellules, les cellules absentes sont vides
+        Retour:
+            txt (str): représentation du labyrinthe
+        """
+        h, w = self.height, self.width
+        # Une ligne d'octets 0/1 par cellule, décodée une seule fois
+        est = b"".join([_BITS[b] for b in self._east])
+        sud = b"".join([_BITS[b] for b in self._south])
+        # Contenu regroupé par ligne : seules les cellules renseignées sont visitées
+        parLigne = {}
+        if content:
+            for (i, j), car in content.items():
+                if 0 <= i < h and 0 <= j < w:
+                    parLigne.setdefault(i, []).append((j, car))
+        lignes = ["┏" + "━━━┳"*(w-1) + "━━━┓\n"]
+        for i in range(h):
+            debut = i*w
+            if i > 0:
+                ligne = sud[debut-w:debut-1].decode("latin-1").translate(_SEPARATEURS)
+                lignes.append("┣" + ligne + ("━━━┫\n" if sud[debut-1] else "   ┫\n"))
+            if i in parLigne:
+                segments = [_CELLULES[b] for b in est[debut:debut+w-1]] + ["   ┃"]
+                for j, car in parLigne[i]:
+                    segments[j] = " " + car + (" ┃" if j == w-1 or est[debut+j] else "  ")
+                lignes.append("┃" + "".join(segments) + "\n")
+            else:
+                lignes.append("┃" + est[debut:debut+w-1].decode("latin-1").translate(_CELLULES) + "   ┃\n")
+        lignes.append("┗" + "━━━┻"*(w-1) + "━━━┛\n")
+        return "".join(lignes)
     
-    def solve_dfs(self, start, stop):
+    @_instrumented
+    def to_png(self, path, cell_px=4, solution=None):
         """
-        Résoudre un labyrinthe et afficher le resultat sur le labyrinthe
-        Résout le labyrinthe en parcourant en profondeur
+        Enregistre une image PNG du labyrinthe (et éventuellement d'un chemin)
+        L'image est produite ligne par ligne (iter_rows) et compressée au fil de l'eau par zlib :
+        la mémoire utilisée ne dépend que de la largeur, jamais de la taille totale de l'image
+        Chaque cellule occupe cell_px x cell_px pixels, murs compris (1 pixel de mur)
+        
+        Arguments:
+            path (str): chemin du fichier
+            cell_px (int): côté d'une cellule en pixels (au moins 2)
+            solution (dict): chemin à colorier (format des méthodes solve_*)
+            
+        Retour:
+            Ne retourne rien
+        """
+        assert cell_px >= 2, f"Erreur : une cellule doit mesurer au moins 2 pixels ({cell_px})"
+        h, w = self.height, self.width
+        p = cell_px
+        chemin = {}
+        for i, j in solution or ():
+            chemin.setdefault(i, set()).add(j)
+        aucun = set()
+        # segments de pixels : intérieur d'une cellule (fond ou chemin), mur, passage
+        interieur = (b"\x00"*(p-1), b"\x02"*(p-1))
+        sudMur = b"\x01"*p
+        sudPassage = (b"\x01" + b"\x00"*(p-1), b"\x01" + b"\x02"*(p-1))
+        compresseur = zlib.compressobj()
+        with open(path, "wb") as f:
+            f.write(b"\x89PNG\r\n\x1a\n")
+            _png_chunk(f, b"IHDR", struct.pack(">IIBBBBB", w*p + 1, h*p + 1, 8, 3, 0, 0, 0))
+            _png_chunk(f, b"PLTE", PNG_PALETTE)
+            # chaque ligne de pixels est précédée de son filtre (0 : aucun)
+            idat = bytearray(compresseur.compress(b"\x00" + b"\x01"*(w*p + 1)))
+            for i, (est, sud) in enumerate(self.iter_rows()):
+                cs, suivant = chemin.get(i, aucun), chemin.get(i+1, aucun)
+                ligne = b"\x00\x01" + b"".join([
+                    interieur[j in cs] + (b"\x01" if est[j] else b"\x02" if j in cs and j+1 in cs else b"\x00")
+                    for j in range(w)])
+                idat += compresseur.compress(ligne*(p-1))
+                ligne = b"\x00" + b"".join([
+                    sudMur if sud[j] else sudPassage[j in cs and j in suivant] for j in range(w)]) + b"\x01"
+                idat += compresseur.compress(ligne)
+                if len(idat) >= PNG_BLOC:
+                    _png_chunk(f, b"IDAT", bytes(idat))
+                    idat.clear()
+            idat += compresseur.flush()
+            _png_chunk(f, b"IDAT", bytes(idat))
+            _png_chunk(f, b"IEND", b"")
+        return None
+
+    @_instrumented
+    def to_svg(self, path, solution=None, cell_px=10):
+        """
+        Enregistre une image SVG du labyrinthe (et éventuellement d'un chemin)
+        Les murs alignés consécutifs sont fusionnés en un seul segment (horizontalement ligne
+        par ligne, verticalement en suivant chaque colonne d'une ligne à la suivante) et
+        les cellules consécutives du chemin en un seul rectangle ; le fichier est écrit au fil de l'eau
+        
+        Arguments:
+            path (str): chemin du fichier
+            solution (dict): chemin à colorier (format des méthodes solve_*)
+            cell_px (int): côté d'une cellule en pixels à l'affichage
+            
+        Retour:
+            Ne retourne rien
+        """
+        h, w = self.height, self.width
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{w*cell_px + 2}" height="{h*cell_px + 2}" '
+                    f'viewBox="-0.1 -0.1 {w + 0.2:g} {h + 0.2:g}">\n')
+            f.write(f'<rect width="{w}" height="{h}" fill="#ffffff"/>\n')
+            if solution:
+                chemin = {}
+                for i, j in solution:
+                    chemin.setdefault(i, []).append(j)
+                f.write('<path fill="#e0483e" d="')
+                for i in sorted(chemin):
+                    colonnes = sorted(chemin[i])
+                    debut = precedente = colonnes[0]
+                    for j in colonnes[1:] + [None]:
+                        if j is None or j != precedente + 1:
+                            n = precedente - debut + 1
+                            f.write(f"M{debut} {i}h{n}v1h-{n}z")
+                            debut = j
+                        precedente = j
+                f.write('"/>\n')
+            f.write('<path fill="none" stroke="#000000" stroke-width="0.1" stroke-linecap="square" '
+                    f'd="M0 0H{w}M0 0V{h}M{w} 0V{h}')
+            # ligne de départ du mur vertical en cours à l'est de chaque colonne (-1 : aucun)
+            debuts = array('i', [-1]) * w
+            for i, (est, sud) in enumerate(self.iter_rows()):
+                segments = []
+                for j in range(w-1):
+                    if est[j]:
+                        if debuts[j] < 0:
+                            debuts[j] = i
+                    elif debuts[j] >= 0:
+                        segments.append(f"M{j+1} {debuts[j]}V{i}")
+                        debuts[j] = -1
+                j = 0
+                while j < w:
+                    if sud[j]:
+                        debut = j
+                        while j < w and sud[j]:
+                            j += 1
+                        segments.append(f"M{debut} {i+1}H{j}")
+                    else:
+                        j += 1
+                f.write("".join(segments))
+            f.write("".join(f"M{j+1} {debuts[j]}V{h}" for j in range(w-1) if debuts[j] >= 0))
+            f.write('"/>\n</svg>\n')
+        return None
+
+    def _traversal(self, start, stop=None, depth_first=False, distances=False):
+        """
+        Moteur de parcours commun aux solveurs et aux calculs de distances (en largeur ou en profondeur)
+        Les cellules sont manipulées par leur indice i*width+j
+        
+        Arguments:
+            start (tuple ou list): cellule de départ, ou liste de cellules de départ (parcours multi-sources)
+            stop (tuple): cellule d'arrivée (None pour parcourir toute la composante)
+            depth_first (bool): parcours en profondeur (pile) au lieu de largeur (file)
+            distances (bool): mémorise aussi la distance de chaque cellule à la source la plus proche
+                              (profondeur dans l'arbre de parcours si depth_first)
+        
+        Retour:
+            pred (array): prédécesseur de chaque cellule, -1 si elle n'a pas été atteinte
+                          (le prédécesseur d'une source est elle-même)
+            developpes (int): nombre de cellules développées
+            dist (array): si distances, distance de chaque cellule, -1 si elle n'a pas été atteinte
+        """
+        w = self.width
+        n = self.height*w
+        east, south = self._east, self._south
+        pred = array('l', [-1]) * n
+        sources = [start] if isinstance(start, tuple) else start
+        t = -1 if stop is None else stop[0]*w + stop[1]
+        # Placer les sources dans la structure d'attente ; le parcours s'arrête quand elle est vide
+        attente = deque()
+        for c in sources:
+            s = c[0]*w + c[1]
+            if pred[s] < 0:
+                pred[s] = s
+                attente.append(s)
+        prendre = attente.pop if depth_first else attente.popleft
+        ajouter = attente.append
+        if distances:
+            dist = array('i', [-1]) * n
+            for s in attente:
+                dist[s] = 0
+            # la distance d'une cellule découverte est fixée au moment où elle est mise en attente
+            def ajouter(m):
+                dist[m] = dist[pred[m]] + 1
+                attente.append(m)
+        limite = n - w
+        developpes = 0
+        while attente:
+            k = prendre()
+            developpes += 1
+            if k == t:
+                break
+            j = k % w
+            m = k - w
+            if m >= 0 and pred[m] < 0 and not south[m >> 3] >> (m & 7) & 1:
+                pred[m] = k
+                ajouter(m)
+            if k < limite and pred[k+w] < 0 and not south[k >> 3] >> (k & 7) & 1:
+                pred[k+w] = k
+                ajouter(k+w)
+            m = k - 1
+            if j and pred[m] < 0 and not east[m >> 3] >> (m & 7) & 1:
+                pred[m] = k
+                ajouter(m)
+            if j < w-1 and pred[k+1] < 0 and not east[k >> 3] >> (k & 7) & 1:
+                pred[k+1] = k
+                ajouter(k+1)
+        if _instrumentation is not None:
+            _instrumentation.count("cells_visited", developpes)
+        if distances:
+            return pred, developpes, dist
+        return pred, developpes
+
+    def _path(self, pred, start, stop):
+        """
+        Reconstruction du chemin à partir des prédécesseurs
         
         Arguments:
+            pred (array): prédécesseurs calculés par _traversal
             start (tuple): cellule de départ
             stop (tuple): cellule de fin
         
         Retour:
-            path (dict): dictionnaire du chemin resultat
+            path (dict): dictionnaire du chemin resultat (vide si stop n'est pas accessible)
         """
-        # Initialisation 
+        w = self.width
         path = {}
-        # Placer D dans la struture d’attente ou et marquer D
-        pile = [start]
-        marquage = {i : False for i in self.get_cells()}
-        # Mémoriser l’élément prédécesseur de D comme étant D
-        pred = {i : None for i in self.get_cells()}
-        pred[start] = start
-        # Tant qu’il reste des cellules non-marquées :
-        cellulesMarque = False
-        trouver = False
-        while trouver == False and cellulesMarque == False:
-            cellulesMarque = True
-            for i in marquage:
-                if marquage[i] == False:
-                    cellulesMarque = False
-            # Prendre la « première » cellule et la retirer de la structure (appelons c, cette cellule)
-            c = pile[-1]
-            marquage[c] = True
-            del pile[-1]
-            # Si c correspond à A 
-            if c == stop:
-                trouver = True
-            else:
-                for i in self.get_reachable_cells(c):
-                    if not marquage[i]:
-                        marquage[i] = True
-                        pile.append(i)
-                        pred[i] = c
-        # Reconstruction du chemin à partir des prédécesseurs
-        c = stop
-        while c != start:
-            path[c] = '*'
-            c = pred[c]
+        k, s = stop[0]*w + stop[1], start[0]*w + start[1]
+        if pred[k] < 0:
+            return path
+        while k != s:
+            path[divmod(k, w)] = '*'
+            k = pred[k]
         path[start] = 'D'
         path[stop] = 'A'
         return path
+
+    @_instrumented
+    def solve_dfs(self, start, stop, stats=False):
+        """
+        Résoudre un labyrinthe et afficher le resultat sur le labyrinthe
+        Résout le labyrinthe en parcourant en profondeur
+        Si le labyrinthe a des boucles (voir braid), le chemin n'est pas forcément le plus court
+        
+        Arguments:
+            start (tuple): cellule de départ
+            stop (tuple): cellule de fin
+            stats (bool): renvoie aussi le nombre de cellules développées
+        
+        Retour:
+            path (dict): dictionnaire du chemin resultat
+            developpes (int): si stats, nombre de cellules développées par cette résolution
+        """
+        pred, developpes = self._traversal(start, stop, depth_first=True)
+        path = self._path(pred, start, stop)
+        return (path, developpes) if stats else path
     
-    def solve_bfs(self, start, stop):
+    @_instrumented
+    def solve_bfs(self, start, stop, stats=False):
         """
         Résoudre un labyrinthe et afficher le resultat sur le labyrinthe
         Résout le labyrinthe en parcourant en largeur
@@ -492,156 +1820,1077 @@ class Maze:
         Arguments:
             start (tuple): cellule de départ
             stop (tuple): cellule de fin
+            stats (bool): renvoie aussi le nombre de cellules développées
         Retour:
             path (dict): dictionnaire du chemin resultat
+            developpes (int): si stats, nombre de cellules développées par cette résolution
         """
-        # Initialisation 
-        path = {}
-        # Placer D dans la struture d’attente file et marquer D
-        file = [start]
-        marquage = {i : False for i in self.get_cells()}
-        # Mémoriser l’élément prédécesseur de D comme étant D
-        pred = {i : None for i in self.get_cells()}
-        pred[start] = start
-        # Tant qu’il reste des cellules non-marquées :
-        cellulesMarque = False
-        trouver = False
-        while trouver == False and cellulesMarque == False:
-            cellulesMarque = True
-            for i in marquage:
-                if marquage[i] == False:
-                    cellulesMarque = False
-            # Prendre la « première » cellule et la retirer de la structure (appelons c, cette cellule)
-            c = file[0]
-            marquage[c] = True
-            del file[0]
-            # Si c correspond à A 
-            if c == stop:
-                trouver = True
-            else:
-                for i in self.get_reachable_cells(c):
-                    if not marquage[i]:
-                        marquage[i] = True
-                        file.append(i)
-                        pred[i] = c
-        # Reconstruction du chemin à partir des prédécesseurs
-        c = stop
-        while c != start:
-            path[c] = '*'
-            c = pred[c]
-        path[start] = 'D'
-        path[stop] = 'A'
-        return path
+        pred, developpes = self._traversal(start, stop)
+        path = self._path(pred, start, stop)
+        return (path, developpes) if stats else path
     
-    def solve_rhr(self, start, stop):
-        # Initialisation 
+    def _reachable_indices(self, k):
+        """
+        Indices des cellules accessibles depuis la cellule d'indice k
+        
+        Argument:
+            k (int): indice i*width+j de la cellule
+        
+        Retour:
+            lst (list): indices des cellules accessibles (nord, sud, ouest, est)
+        """
+        w = self.width
+        east, south = self._east, self._south
+        j = k % w
+        lst = []
+        m = k - w
+        if m >= 0 and not south[m >> 3] >> (m & 7) & 1:
+            lst.append(m)
+        if k < (self.height-1)*w and not south[k >> 3] >> (k & 7) & 1:
+            lst.append(k+w)
+        m = k - 1
+        if j and not east[m >> 3] >> (m & 7) & 1:
+            lst.append(m)
+        if j < w-1 and not east[k >> 3] >> (k & 7) & 1:
+            lst.append(k+1)
+        return lst
+
+    @_instrumented
+    def solve_astar(self, start, stop, stats=False):
+        """
+        Résout le labyrinthe avec l'algorithme A*
+        Heuristique : distance de Manhattan à stop (distance_man), admissible et monotone
+        
+        Arguments:
+            start (tuple): cellule de départ
+            stop (tuple): cellule de fin
+            stats (bool): renvoie aussi le nombre de cellules développées
+        Retour:
+            path (dict): dictionnaire du chemin resultat (même format que solve_bfs)
+            developpes (int): si stats, nombre de cellules développées par cette résolution
+        """
+        w = self.width
+        n = self.height*w
+        s, t = start[0]*w + start[1], stop[0]*w + stop[1]
+        ti, tj = stop
+        cout = array('i', [-1]) * n
+        pred = array('l', [-1]) * n
+        ferme = bytearray(n)
+        cout[s] = 0
+        pred[s] = s
+        # frontière : (coût estimé, heuristique, indice) ; à égalité on préfère la cellule la plus proche de stop
+        heuristique = self.distance_man(start, stop)
+        frontiere = [(heuristique, heuristique, s)]
+        developpes = 0
+        while frontiere:
+            _, _, k = heappop(frontiere)
+            if ferme[k]:
+                continue
+            ferme[k] = 1
+            developpes += 1
+            if k == t:
+                break
+            g = cout[k] + 1
+            for m in self._reachable_indices(k):
+                if cout[m] < 0 or g < cout[m]:
+                    cout[m] = g
+                    pred[m] = k
+                    i, j = divmod(m, w)
+                    heuristique = abs(i-ti) + abs(j-tj)
+                    heappush(frontiere, (g + heuristique, heuristique, m))
+        if _instrumentation is not None:
+            _instrumentation.count("cells_visited", developpes)
+        path = self._path(pred, start, stop)
+        return (path, developpes) if stats else path
+
+    @_instrumented
+    def solve_bidirectional(self, start, stop, stats=False):
+        """
+        Résout le labyrinthe par deux parcours en largeur simultanés, depuis start et depuis stop
+        La plus petite des deux frontières est développée d'un niveau à chaque étape ;
+        le niveau en cours est terminé dès la première rencontre pour garantir un plus court chemin
+        
+        Arguments:
+            start (tuple): cellule de départ
+            stop (tuple): cellule de fin
+            stats (bool): renvoie aussi le nombre de cellules développées
+        Retour:
+            path (dict): dictionnaire du chemin resultat (même format que solve_bfs)
+            developpes (int): si stats, nombre de cellules développées par cette résolution
+        """
+        w = self.width
+        n = self.height*w
+        s, t = start[0]*w + start[1], stop[0]*w + stop[1]
+        cotes = []
+        for origine in (s, t):
+            pred, dist = array('l', [-1]) * n, array('i', [-1]) * n
+            pred[origine], dist[origine] = origine, 0
+            cotes.append([pred, dist, [origine]])
+        developpes = 0
+        # meilleure rencontre : (longueur du chemin, cellule atteinte par les deux parcours)
+        meilleur = (0, s) if s == t else None
+        while meilleur is None and cotes[0][2] and cotes[1][2]:
+            cote = 0 if len(cotes[0][2]) <= len(cotes[1][2]) else 1
+            pred, dist, frontiere = cotes[cote]
+            predAutre, distAutre, _ = cotes[1-cote]
+            suivante = []
+            for k in frontiere:
+                developpes += 1
+                d = dist[k] + 1
+                for m in self._reachable_indices(k):
+                    if pred[m] >= 0:
+                        continue
+                    pred[m], dist[m] = k, d
+                    suivante.append(m)
+                    if predAutre[m] >= 0:
+                        longueur = d + distAutre[m]
+                        if meilleur is None or longueur < meilleur[0]:
+                            meilleur = (longueur, m)
+            cotes[cote][2] = suivante
+        if _instrumentation is not None:
+            _instrumentation.count("cells_visited", developpes)
         path = {}
-        cell = start
-        chemin = []
-        depart = True
-        while cell != stop:
-            if depart:
-                depart = False
-                cellPred = start
-                cells = laby.get_reachable_cells(start)
-                if (start[0]+1,start[1]) in cells:
-                    cell = (start[0]+1,start[1])
-                elif (start[0],start[1]+1) in cells:
-                    cell = (start[0],start[1]+1)
-                chemin.append(cell)
-            temp = cell
-            cells = laby.get_reachable_cells(cell)
-            # dessus
-            if cellPred[0]-cell[0] == 1:
-                if (cell[0],cell[1]+1) in cells:
-                    cell = (cell[0], cell[1]+1)
-                elif (cell[0]-1,cell[1]) in cells:
-                    cell = (cell[0]-1, cell[1])
-                elif (cell[0],cell[1]-1) in cells:
-                    cell = (cell[0], cell[1]-1)
-                elif (cell[0]+1, cell[1]) in cells:
-                    cell = (cell[0]+1,cell[1])
-            # dessous
-            elif cellPred[0]-cell[0] == -1:
-                if (cell[0],cell[1]-1) in cells:
-                    cell = (cell[0],cell[1]-1)
-                elif (cell[0]+1,cell[1]) in cells:
-                    cell = (cell[0]+1,cell[1])
-                elif (cell[0],cell[1]+1) in cells:
-                    cell = (cell[0],cell[1]+1)
-                elif (cell[0]-1,cell[1]) in cells:
-                    cell = (cell[0]-1,cell[1])
-            # droite
-            elif cellPred[1]-cell[1] == -1:
-                if (cell[0]+1,cell[1]) in cells:
-                    cell = (cell[0]+1,cell[1])
-                elif (cell[0],cell[1]+1) in cells:
-                    cell = (cell[0],cell[1]+1)
-                elif (cell[0]-1,cell[1]) in cells:
-                    cell = (cell[0]-1,cell[1])
-                elif (cell[0],cell[1]-1) in cells:
-                    cell = (cell[0],cell[1]-1)
-            # gauche
-            elif cellPred[1]-cell[1] == 1:
-                if (cell[0]-1,cell[1]) in cells:
-                    cell = (cell[0]-1,cell[1])
-                elif (cell[0],cell[1]-1) in cells:
-                    cell = (cell[0],cell[1]-1)
-                elif (cell[0]+1,cell[1]) in cells:
-                    cell = (cell[0]+1,cell[1])
-                elif (cell[0],cell[1]+1) in cells:
-                    cell = (cell[0],cell[1]+1)
-            chemin.append(cell)              
-            cellPred = temp
-        for c in chemin:
-            path[c] = '*'
+        if meilleur is None:
+            return (path, developpes) if stats else path
+        # Reconstruction : de la rencontre vers stop, puis de la rencontre vers start
+        predS, predT = cotes[0][0], cotes[1][0]
+        k = meilleur[1]
+        while k != t:
+            k = predT[k]
+            path[divmod(k, w)] = '*'
+        k = meilleur[1]
+        while k != s:
+            path[divmod(k, w)] = '*'
+            k = predS[k]
         path[start] = 'D'
         path[stop] = 'A'
+        return (path, developpes) if stats else path
+
+    @_instrumented
+    def flow_field(self, targets):
+        """
+        Champ de directions vers les cibles, en un seul parcours en largeur lancé depuis
+        toutes les cibles à la fois : chaque agent obtient ensuite son prochain pas en O(1),
+        au lieu d'un appel à solve_bfs par agent
+        
+        Argument:
+            targets (iterable): cellules cibles (sorties)
+        
+        Retour:
+            (FlowField): distances et directions vers la cible la plus proche
+        """
+        w = self.width
+        pred, _, dist = self._traversal(list(targets), distances=True)
+        # la cellule m découverte depuis pred[m] se dirige vers lui
+        # (nord et sud en dernier : prioritaires si width == 1, où -width == -1)
+        sens = {-1: 2, 1: 3, -w: 0, w: 1}
+        direction = bytearray(map(sens.get, map(int.__sub__, pred, range(len(pred))), repeat(4)))
+        # cellules sans cible accessible (pred = -1) : aucun pas
+        if dist.count(-1):
+            for m in [m for m, d in enumerate(dist) if d < 0]:
+                direction[m] = 4
+        return FlowField(self, dist, direction)
+
+    def track(self, start, stop):
+        """
+        Active le mode incrémental : les composantes connexes et un chemin de start à stop
+        sont maintenus à chaque add_wall / remove_wall, en n'explorant que la région touchée
+          - ouverture d'un mur : fusion des composantes (la plus petite est renommée),
+            raccourci du chemin si le passage relie deux de ses cellules
+          - fermeture d'un mur : parcours alternés depuis ses deux côtés pour détecter une séparation,
+            le chemin n'est recalculé (détour local) que si le mur le coupe
+        Le chemin reste valide mais n'est plus forcément le plus court après des ouvertures
+        
+        Arguments:
+            start (tuple): cellule de départ
+            stop (tuple): cellule de fin
+        
+        Retour:
+            Ne retourne rien
+        """
+        self._suivi = _IncrementalTracker(self, start, stop)
+        return None
+
+    def untrack(self):
+        """
+        Désactive le mode incrémental
+        
+        Retour:
+            Ne retourne rien
+        """
+        self._suivi = None
+        return None
+
+    def tracked_path(self):
+        """
+        Chemin maintenu par le mode incrémental (voir track)
+        
+        Retour:
+            path (dict): dictionnaire du chemin (même format que solve_bfs), vide si stop est inaccessible
+        """
+        assert self._suivi is not None, "Erreur : le mode incrémental n'est pas activé (voir track)"
+        suivi = self._suivi
+        path = {}
+        if suivi.chemin is not None:
+            for k in reversed(suivi.chemin):
+                path[divmod(k, self.width)] = '*'
+            path[suivi.start] = 'D'
+            path[suivi.stop] = 'A'
         return path
+
+    def connected(self, c1, c2):
+        """
+        Indique si deux cellules sont reliées
+        En O(1) si le mode incrémental est activé, par un parcours sinon
+        
+        Arguments:
+            c1 (tuple): cellule 1
+            c2 (tuple): cellule 2
+        
+        Retour:
+            (bool): True si c2 est accessible depuis c1
+        """
+        w = self.width
+        k1, k2 = c1[0]*w + c1[1], c2[0]*w + c2[1]
+        if self._suivi is not None:
+            return self._suivi.comp[k1] == self._suivi.comp[k2]
+        return self._traversal(c1, c2)[0][k2] >= 0
+
+    @_instrumented
+    def solve_rhr(self, start, stop, raw=False, stats=False):
+        """
+        Résout le labyrinthe en suivant le mur de droite
+        État : (cellule, direction) ; à chaque pas on essaie, dans l'ordre de _MAIN_DROITE,
+        de tourner à droite, d'aller tout droit, de tourner à gauche puis de faire demi-tour
+        Un état déjà rencontré signifie que la marche tourne en rond (stop inaccessible en suivant le mur)
+        
+        Arguments:
+            start (tuple): cellule de départ
+            stop (tuple): cellule de fin
+            raw (bool): renvoie aussi la marche complète
+            stats (bool): renvoie aussi le nombre de cellules développées (longueur de la marche)
+        
+        Retour:
+            path (dict): chemin simple (marche sans ses boucles), vide si stop n'est pas atteint
+            marche (list): si raw, liste des cellules parcourues dans l'ordre
+            developpes (int): si stats, nombre de cellules développées par cette résolution
+        """
+        w = self.width
+        n = self.height*w
+        east, south = self._east, self._south
+        pas = (-w, w, -1, 1)
+        s, t = start[0]*w + start[1], stop[0]*w + stop[1]
+        etats = bytearray(4*n)
+        marche = [s]
+        # chemin simple : pile des cellules et position de chaque cellule dans la pile
+        chemin = [s]
+        position = array('l', [-1]) * n
+        position[s] = 0
+        k, cap = s, 1  # départ en direction du sud
+        atteint = s == t
+        while not atteint and not etats[4*k + cap]:
+            etats[4*k + cap] = 1
+            j = k % w
+            for d in _MAIN_DROITE[cap]:
+                if d == 0:
+                    m = k - w
+                    ok = m >= 0 and not south[m >> 3] >> (m & 7) & 1
+                elif d == 1:
+                    ok = k < n-w and not south[k >> 3] >> (k & 7) & 1
+                elif d == 2:
+                    m = k - 1
+                    ok = j > 0 and not east[m >> 3] >> (m & 7) & 1
+                else:
+                    ok = j < w-1 and not east[k >> 3] >> (k & 7) & 1
+                if ok:
+                    break
+            else:
+                # cellule totalement emmurée
+                break
+            k, cap = k + pas[d], d
+            marche.append(k)
+            if position[k] >= 0:
+                # retour sur une cellule du chemin : on efface la boucle
+                for c in chemin[position[k]+1:]:
+                    position[c] = -1
+                del chemin[position[k]+1:]
+            else:
+                position[k] = len(chemin)
+                chemin.append(k)
+            atteint = k == t
+        if _instrumentation is not None:
+            _instrumentation.count("cells_visited", len(marche))
+        path = {}
+        if atteint:
+            for c in reversed(chemin):
+                path[divmod(c, w)] = '*'
+            path[start] = 'D'
+            path[stop] = 'A'
+        if not (raw or stats):
+            return path
+        resultat = (path,)
+        if raw:
+            resultat += ([divmod(c, w) for c in marche],)
+        if stats:
+            resultat += (len(marche),)
+        return resultat
     
     def dead_end_number(self):
-        culSac = 0
-        neig = laby.neighbors
-        for i in neig:
-            if len(self.get_reachable_cells(i)) == 1:
-                culSac += 1
-        return culSac
-    
-    def dead_end_number(self):
-        culSac = 0
-        neig = laby.neighbors
-        for i in neig:
-            if len(self.get_reachable_cells(i)) == 1:
-                culSac += 1
+        """
+        Nombre de culs-de-sac (cellules n'ayant qu'une seule cellule accessible)
+        
+        Retour:
+            culSac (int): nombre de culs-de-sac du labyrinthe
+        """
+        culSac = self._degrees().count(1)
         return culSac
+
+    def _passages(self):
+        """
+        Nombre de murs ouverts, par comptage des bits nuls
+        (les bits de bord et de remplissage valent toujours 1)
+        
+        Retour:
+            (int): nombre de passages entre cellules contigües
+        """
+        total = 8*(len(self._east) + len(self._south))
+        return total - int.from_bytes(self._east, "little").bit_count() \
+                     - int.from_bytes(self._south, "little").bit_count()
+
+    def is_perfect(self):
+        """
+        Le labyrinthe est-il parfait (un et un seul chemin entre deux cellules quelconques) ?
+        
+        Retour:
+            (bool): True si le graphe des passages est un arbre couvrant
+        """
+        n = self.height*self.width
+        return self._passages() == n-1 and min(self.distances_from((0, 0))) >= 0
     
+    @_instrumented
+    def distances_from(self, cell):
+        """
+        Calcule, en un seul parcours en largeur, la distance de cell à toutes les cellules
+        
+        Argument:
+            cell (tuple): cellule de départ
+        
+        Retour:
+            dist (array): distance de chaque cellule d'indice i*width+j, -1 si elle n'est pas accessible
+        """
+        dist = self._traversal(cell, distances=True)[2]
+        return dist
+
+    def _degrees(self):
+        """
+        Nombre de cellules accessibles depuis chaque cellule
+        
+        Retour:
+            deg (bytearray): degré de chaque cellule d'indice i*width+j
+        """
+        h, w = self.height, self.width
+        east, south = self._east, self._south
+        deg = bytearray(h*w)
+        for k in range(h*w):
+            if k % w < w-1 and not east[k >> 3] >> (k & 7) & 1:
+                deg[k] += 1
+                deg[k+1] += 1
+            if k < (h-1)*w and not south[k >> 3] >> (k & 7) & 1:
+                deg[k] += 1
+                deg[k+w] += 1
+        return deg
+
     def distance_geo(self, c1, c2):
-        return len(self.solve_bfs(c1, c2))-1
+        """
+        Distance géodésique (nombre de déplacements) entre deux cellules
+        
+        Arguments:
+            c1 (tuple): cellule 1
+            c2 (tuple): cellule 2
+        
+        Retour:
+            (int): distance, -1 si c2 n'est pas accessible depuis c1
+        """
+        if self._distance_index is not None:
+            k1, k2 = c1[0]*self.width + c1[1], c2[0]*self.width + c2[1]
+            profondeur = self._distance_index[0]
+            return profondeur[k1] + profondeur[k2] - 2*profondeur[self._lca(k1, k2)]
+        return self.distances_from(c1)[c2[0]*self.width + c2[1]]
+
+    @_instrumented
+    def build_distance_index(self):
+        """
+        Prépare les requêtes de distance sur un labyrinthe parfait (arbre couvrant) :
+        l'arbre est enraciné en (0,0), puis on mémorise la profondeur de chaque cellule et
+        ses ancêtres à distance 1, 2, 4, 8... (remontée binaire)
+        distance_geo et solve_lca répondent ensuite en O(log n) sans parcours
+        L'index est invalidé par toute modification des murs (add_wall, remove_wall...)
+        
+        Retour:
+            Ne retourne rien
+        """
+        n = self.height*self.width
+        parent, _, profondeur = self._traversal((0, 0), distances=True)
+        assert min(profondeur) >= 0 and sum(self._degrees()) == 2*(n-1), \
+            "Erreur : l'index de distances nécessite un labyrinthe parfait"
+        ancetres = [array('i', parent)]
+        # ancetres[p][k] : ancêtre de k à distance 2**p (la racine est son propre ancêtre)
+        while (1 << len(ancetres)) <= max(profondeur):
+            prec = ancetres[-1]
+            ancetres.append(array('i', map(prec.__getitem__, prec)))
+        self._distance_index = (profondeur, ancetres)
+        return None
+
+    def _lca(self, a, b):
+        """
+        Plus proche ancêtre commun de deux cellules dans l'arbre de build_distance_index
+        
+        Arguments:
+            a (int): indice de la cellule 1
+            b (int): indice de la cellule 2
+        
+        Retour:
+            (int): indice de l'ancêtre commun
+        """
+        profondeur, ancetres = self._distance_index
+        if profondeur[a] < profondeur[b]:
+            a, b = b, a
+        ecart = profondeur[a] - profondeur[b]
+        p = 0
+        while ecart:
+            if ecart & 1:
+                a = ancetres[p][a]
+            ecart >>= 1
+            p += 1
+        if a == b:
+            return a
+        for p in range(len(ancetres)-1, -1, -1):
+            if ancetres[p][a] != ancetres[p][b]:
+                a, b = ancetres[p][a], ancetres[p][b]
+        return ancetres[0][a]
+
+    @_instrumented
+    def solve_lca(self, start, stop, stats=False):
+        """
+        Chemin entre deux cellules à l'aide de l'index de distances (construit au besoin)
+        Coût proportionnel à la longueur du chemin, sans parcours du labyrinthe
+        Un labyrinthe qui n'est pas parfait est résolu par solve_bfs
+        
+        Arguments:
+            start (tuple): cellule de départ
+            stop (tuple): cellule de fin
+            stats (bool): renvoie aussi le nombre de cellules développées
+        Retour:
+            path (dict): dictionnaire du chemin resultat (même format que solve_bfs)
+            developpes (int): si stats, nombre de cellules parcourues dans l'index (sans compter
+                              son éventuelle construction), ou développées par solve_bfs
+        """
+        if self._distance_index is None:
+            if not self.is_perfect():
+                # l'arbre de l'index ne contient pas tous les passages d'un labyrinthe à boucles
+                return self.solve_bfs(start, stop, stats)
+            self.build_distance_index()
+        w = self.width
+        parent = self._distance_index[1][0]
+        s, t = start[0]*w + start[1], stop[0]*w + stop[1]
+        ancetre = self._lca(s, t)
+        # de stop jusqu'à l'ancêtre commun, puis de start jusqu'à l'ancêtre commun (ordre de solve_bfs)
+        path = {}
+        k = t
+        while k != ancetre:
+            path[divmod(k, w)] = '*'
+            k = parent[k]
+        montee = []
+        k = s
+        while k != ancetre:
+            montee.append(k)
+            k = parent[k]
+        path[divmod(ancetre, w)] = '*'
+        for k in reversed(montee):
+            path[divmod(k, w)] = '*'
+        path[start] = 'D'
+        path[stop] = 'A'
+        return (path, len(path)) if stats else path
     
     def distance_man(self, c1, c2):
         return abs(c1[0]-c2[0]) + abs(c1[1]-c2[1])
     
+    @_instrumented
     def worst_path_len(self, depart):
-        neig = laby.neighbors
-        culSac = []
-        for i in neig:
-            if len(self.get_reachable_cells(i)) == 1:
-                culSac.append(i)
+        """
+        Longueur du plus long chemin entre depart et un cul-de-sac
+        (distances en largeur : exact aussi sur un labyrinthe à boucles, voir braid)
+        
+        Argument:
+            depart (tuple): cellule de départ
+        
+        Retour:
+            distance (int): plus grande distance de depart à un cul-de-sac accessible,
+                            0 s'il n'en reste aucun (labyrinthe entièrement tressé)
+        """
+        dist = self.distances_from(depart)
+        deg = self._degrees()
         distance = 0
-        for i in culSac:
-            if self.distance_geo((depart), i) > distance:
-                distance = self.distance_geo((depart), i)
+        for k in range(len(deg)):
+            if deg[k] == 1 and dist[k] > distance:
+                distance = dist[k]
         return distance
 
+    @_instrumented
+    def diameter(self, exact=False):
+        """
+        Diamètre du labyrinthe : plus grande distance entre deux cellules
+        Double parcours en largeur : exact sur un labyrinthe parfait, borne inférieure sur un
+        labyrinthe à boucles (deux parcours, adapté au calcul de scores)
+        exact=True sur un labyrinthe à boucles : encadrement des excentricités (Takes et Kosters),
+        chaque parcours resserre les bornes de toutes les cellules et écarte celles qui ne peuvent
+        plus dépasser le meilleur diamètre connu ; de quelques dizaines à plusieurs centaines de
+        parcours selon le tressage (plusieurs dizaines de secondes en 1000x1000)
+        
+        Argument:
+            exact (bool): calcul exact même si le labyrinthe a des boucles
+        
+        Retour:
+            (int): plus grande distance entre deux cellules de la composante contenant (0,0)
+                   (borne inférieure si exact est faux et le labyrinthe a des boucles)
+        """
+        w = self.width
+        n = self.height*w
+        dist = self.distances_from((0, 0))
+        loin = max(range(n), key=dist.__getitem__)
+        distLoin = self.distances_from(divmod(loin, w))
+        borne = max(distLoin)
+        if not exact or (self._passages() == n-1 and min(dist) >= 0):
+            return borne
+        # bornes sur l'excentricité de chaque cellule encore candidate : après un parcours depuis v,
+        # max(d(v,x), ecc(v)-d(v,x)) <= ecc(x) <= ecc(v)+d(v,x) ; x est écartée dès que ecc(x) <= borne
+        bas = array('i', distLoin)
+        haut = array('i', [d + borne for d in distLoin])
+        candidats = [k for k in range(n) if distLoin[k] >= 0 and haut[k] > borne]
+        haute = True
+        while candidats:
+            # alternativement la cellule la plus excentrée possible et la plus centrale
+            if haute:
+                v = max(candidats, key=haut.__getitem__)
+            else:
+                v = min(candidats, key=bas.__getitem__)
+            haute = not haute
+            d = self.distances_from(divmod(v, w))
+            e = max(d)
+            borne = max(borne, e)
+            suivants = []
+            for k in candidats:
+                dk = d[k]
+                if e + dk < haut[k]:
+                    haut[k] = e + dk
+                if max(dk, e - dk) > bas[k]:
+                    bas[k] = max(dk, e - dk)
+                if k != v and haut[k] > borne:
+                    suivants.append(k)
+            candidats = suivants
+        return borne
+
+
+class ChunkedMaze:
+    """
+    Classe Labyrinthe non borné, découpé en tuiles
+    Chaque tuile de tile_height x tile_width cellules est un Maze généré à la demande,
+    de façon déterministe à partir de (seed, coordonnées de la tuile) ; deux tuiles
+    voisines communiquent par une porte dont la position ne dépend que de seed et de leur frontière,
+    le graphe global est donc connexe
+    Les tuiles résidentes sont conservées dans un cache LRU de taille bornée
+    Les cellules sont des tuples (l,c) d'entiers quelconques (éventuellement négatifs)
+    """
+    def __init__(self, tile_height, tile_width, seed, algorithm="wilson", max_tiles=64):
+        """
+        Constructeur
+        
+        Arguments:
+            tile_height (int): hauteur d'une tuile
+            tile_width (int): largeur d'une tuile
+            seed (int): graine globale
+            algorithm (str): générateur des tuiles ("btree", "sidewinder", "fusion", "exploration", "wilson")
+            max_tiles (int): nombre maximal de tuiles conservées en mémoire
+        """
+        assert hasattr(Maze, "gen_" + algorithm), f"Erreur : générateur inconnu {algorithm}"
+        self.tile_height = tile_height
+        self.tile_width  = tile_width
+        self.seed        = seed
+        self.algorithm   = algorithm
+        self.max_tiles   = max_tiles
+        self._tiles      = OrderedDict()
+
+    def tile(self, ti, tj):
+        """
+        Renvoie la tuile (ti, tj), générée au premier accès puis conservée dans le cache
+        
+        Arguments:
+            ti (int): ligne de la tuile
+            tj (int): colonne de la tuile
+        
+        Retour:
+            (Maze): labyrinthe de la tuile (coordonnées locales)
+        """
+        cle = (ti, tj)
+        tuile = self._tiles.get(cle)
+        if tuile is None:
+            rng = Random(f"{self.seed}/{ti}/{tj}")
+            tuile = getattr(Maze, "gen_" + self.algorithm)(self.tile_height, self.tile_width, rng)
+            self._tiles[cle] = tuile
+            if len(self._tiles) > self.max_tiles:
+                # éviction de la tuile utilisée le moins récemment
+                self._tiles.popitem(last=False)
+        else:
+            self._tiles.move_to_end(cle)
+        return tuile
+
+    def _door(self, sens, ti, tj):
+        """
+        Position de la porte sur une frontière entre tuiles
+        
+        Arguments:
+            sens (str): "E" pour la frontière entre (ti,tj) et (ti,tj+1), "S" entre (ti,tj) et (ti+1,tj)
+            ti (int): ligne de la tuile
+            tj (int): colonne de la tuile
+        
+        Retour:
+            (int): ligne (frontière "E") ou colonne (frontière "S") locale de la porte
+        """
+        taille = self.tile_height if sens == "E" else self.tile_width
+        return Random(f"{self.seed}/{sens}/{ti}/{tj}").randrange(taille)
+
+    def get_reachable_cells(self, c):
+        """
+        Renvoie la liste des cellules accessibles depuis c
+        
+        Argument:
+            c (tuple): cellule (coordonnées globales)
+        
+        Retour:
+            lst (list): liste de cellules
+        """
+        th, tw = self.tile_height, self.tile_width
+        i, j = c
+        ti, li = divmod(i, th)
+        tj, lj = divmod(j, tw)
+        lst = [(ti*th + a, tj*tw + b) for a, b in self.tile(ti, tj).get_reachable_cells((li, lj))]
+        # portes vers les tuiles voisines
+        if li == 0 and self._door("S", ti-1, tj) == lj:
+            lst.append((i-1, j))
+        if li == th-1 and self._door("S", ti, tj) == lj:
+            lst.append((i+1, j))
+        if lj == 0 and self._door("E", ti, tj-1) == li:
+            lst.append((i, j-1))
+        if lj == tw-1 and self._door("E", ti, tj) == li:
+            lst.append((i, j+1))
+        return lst
+
+    def region(self, top, left, height, width):
+        """
+        Extrait une fenêtre rectangulaire sous forme de Maze (pour l'afficher ou la résoudre)
+        Les passages qui sortent de la fenêtre sont fermés
+        
+        Arguments:
+            top (int): ligne globale du coin supérieur gauche
+            left (int): colonne globale du coin supérieur gauche
+            height (int): hauteur de la fenêtre
+            width (int): largeur de la fenêtre
+        
+        Retour:
+            laby (Maze): labyrinthe de la fenêtre (coordonnées relatives au coin supérieur gauche)
+        """
+        th, tw = self.tile_height, self.tile_width
+        laby = Maze(height, width)
+        murs = []
+        # parcours tuile par tuile : chaque tuile touchée n'est générée qu'une fois,
+        # même si une ligne de la fenêtre traverse plus de max_tiles tuiles
+        for ti in range(top // th, (top + height - 1) // th + 1):
+            for tj in range(left // tw, (left + width - 1) // tw + 1):
+                for i in range(max(top, ti*th) - top, min(top + height, (ti+1)*th) - top):
+                    for j in range(max(left, tj*tw) - left, min(left + width, (tj+1)*tw) - left):
+                        for a, b in self.get_reachable_cells((top+i, left+j)):
+                            a, b = a-top, b-left
+                            if (a, b) in ((i, j+1), (i+1, j)) and a < height and b < width:
+                                murs.append(((i, j), (a, b)))
+        laby.remove_walls(murs)
+        return laby
+
+
+class LazyMaze:
+    """
+    Classe Labyrinthe paresseux : vue d'un labyrinthe de taille quelconque dont les murs
+    sont calculés à la demande, sans jamais construire la grille
+    Seuls les algorithmes locaux s'y prêtent :
+      - "btree" : chaque cellule ne dépend que de son propre tirage
+      - "sidewinder" : une cellule dépend des tirages de sa séquence dans sa ligne
+    Les tirages proviennent d'un générateur à compteur : un mélange (splitmix64) de
+    (seed, ligne, colonne), si bien que la mémoire utilisée est en O(1) quelle que soit la taille
+    Le labyrinthe obtenu ne dépend que de seed (il diffère de gen_btree(h, w, Random(seed)))
+    """
+    def __init__(self, height, width, seed, algorithm="btree"):
+        """
+        Constructeur
+        
+        Arguments:
+            height (int): hauteur du labyrinthe
+            width (int): largeur du labyrinthe
+            seed (int): graine
+            algorithm (str): "btree" ou "sidewinder"
+        """
+        assert algorithm in ("btree", "sidewinder"), \
+            f"Erreur : le générateur {algorithm} ne peut pas être évalué paresseusement"
+        self.height    = height
+        self.width     = width
+        self.seed      = seed
+        self.algorithm = algorithm
+        self._graine   = _splitmix(seed & 0xFFFFFFFFFFFFFFFF)
+
+    def _alea(self, *cle):
+        """
+        Tirage pseudo-aléatoire sur 64 bits associé à une clé (générateur à compteur)
+        
+        Argument:
+            cle (int): entiers identifiant le tirage (ligne, colonne...)
+        
+        Retour:
+            (int): entier de 0 à 2**64-1, toujours le même pour une même clé
+        """
+        x = self._graine
+        for v in cle:
+            x = _splitmix(x ^ v)
+        return x
+
+    def _walls(self, i, j):
+        """
+        Murs est et sud de la cellule (i,j)
+        
+        Arguments:
+            i (int): ligne de la cellule
+            j (int): colonne de la cellule
+        
+        Retour:
+            (est, sud): 1 pour un mur, 0 pour un passage (même convention que iter_rows)
+        """
+        h, w = self.height, self.width
+        if self.algorithm == "btree":
+            if i < h-1 and j < w-1:
+                pile = self._alea(i, j) & 1
+                return pile, 1 - pile
+            return int(j == w-1), int(i == h-1)
+        if i == h-1:
+            return int(j == w-1), 1
+        # sidewinder : la séquence se prolonge vers l'est tant que le tirage vaut 0
+        ouvert = lambda c: c < w-1 and not self._alea(i, c) & 1
+        debut = j
+        while debut > 0 and ouvert(debut-1):
+            debut -= 1
+        fin = j
+        while ouvert(fin):
+            fin += 1
+        # la séquence debut..fin est fermée par un passage vers le sud, tiré selon sa première cellule
+        creuse = debut + self._alea(i, debut, 1) % (fin - debut + 1)
+        return int(not ouvert(j)), int(creuse != j)
+
+    def get_reachable_cells(self, c):
+        """
+        Renvoie la liste des cellules accessibles depuis c
+        
+        Argument:
+            c (tuple): cellule dont on veut connaître les cellules accessibles
+        
+        Retour:
+            lst (list): liste de cellules
+        """
+        i, j = c
+        est, sud = self._walls(i, j)
+        lst = []
+        if i > 0 and not self._walls(i-1, j)[1]:
+            lst.append((i-1, j))
+        if not sud:
+            lst.append((i+1, j))
+        if j > 0 and not self._walls(i, j-1)[0]:
+            lst.append((i, j-1))
+        if not est:
+            lst.append((i, j+1))
+        return lst
 
-def afficherLabWilson(event):
+    def iter_rows(self, top=0, left=0, height=None, width=None):
+        """
+        Parcourt une fenêtre du labyrinthe ligne par ligne sous forme de bits de murs
+        (format de Maze.iter_rows) ; les passages qui sortent de la fenêtre sont fermés
+        
+        Arguments:
+            top (int): première ligne de la fenêtre
+            left (int): première colonne de la fenêtre
+            height (int): hauteur de la fenêtre (par défaut : jusqu'en bas)
+            width (int): largeur de la fenêtre (par défaut : jusqu'au bord droit)
+        
+        Retour:
+            générateur de couples (est, sud) de bytearray de longueur width
+        """
+        height = self.height - top if height is None else height
+        width = self.width - left if width is None else width
+        assert 0 <= top and top + height <= self.height and 0 <= left and left + width <= self.width, \
+            f"Erreur : la fenêtre ({top}, {left}, {height}, {width}) sort du labyrinthe"
+        for i in range(top, top + height):
+            est, sud = bytearray(width), bytearray(width)
+            for j in range(width):
+                est[j], sud[j] = self._walls(i, left + j)
+            est[width-1] = 1
+            if i == top + height - 1:
+                sud = bytearray(b'\x01')*width
+            yield est, sud
+
+    def region(self, top, left, height, width):
+        """
+        Extrait une fenêtre rectangulaire sous forme de Maze (pour l'afficher ou la résoudre)
+        
+        Arguments:
+            top (int): première ligne de la fenêtre
+            left (int): première colonne de la fenêtre
+            height (int): hauteur de la fenêtre
+            width (int): largeur de la fenêtre
+        
+        Retour:
+            laby (Maze): labyrinthe de la fenêtre (coordonnées relatives au coin supérieur gauche)
+        """
+        laby = Maze.from_rows(height, width, self.iter_rows(top, left, height, width))
+        laby.algorithm = self.algorithm
+        return laby
+
+    def overlay(self, content=None, top=0, left=0, height=None, width=None):
+        """
+        Représentation textuelle d'une fenêtre du labyrinthe avec contenu des cellules
+        
+        Arguments:
+            content (dict): contenu des cellules (coordonnées globales), par exemple un chemin
+            top, left, height, width: fenêtre à représenter (par défaut : tout le labyrinthe)
+        
+        Retour:
+            txt (str): représentation de la fenêtre (même format que Maze.overlay)
+        """
+        height = self.height - top if height is None else height
+        width = self.width - left if width is None else width
+        contenu = {(i - top, j - left): car for (i, j), car in (content or {}).items()}
+        return self.region(top, left, height, width).overlay(contenu)
+
+
+def _splitmix(x):
+    """
+    Fonction de mélange splitmix64 (générateur à compteur de LazyMaze)
+    
+    Argument:
+        x (int): entier de 0 à 2**64-1
+    
+    Retour:
+        (int): entier de 0 à 2**64-1
+    """
+    x = (x + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return x ^ (x >> 31)
+
+
+def _png_chunk(f, nature, donnees):
+    """
+    Écrit un bloc PNG : longueur, type, données et somme de contrôle CRC-32
+    """
+    f.write(struct.pack(">I", len(donnees)) + nature + donnees
+            + struct.pack(">I", zlib.crc32(nature + donnees) & 0xFFFFFFFF))
+
+
+def _generate_jobs(algorithm, h, w, graines):
+    """
+    Tâche d'un processus de Maze.generate_batch : un labyrinthe sérialisé par graine
+    """
+    generateur = getattr(Maze, "gen_" + algorithm)
+    lot = []
+    for graine in graines:
+        laby = generateur(h, w, Random(graine))
+        laby.seed = graine
+        lot.append(laby.to_bytes())
+    return lot
+
+
+# Interface web : la génération tourne dans une tâche asyncio qui rend la main au navigateur
+# pendant la construction (barre de progression, annulation) ; au-delà de RENDU_TEXTE_MAX cellules,
+# le labyrinthe est dessiné ligne par ligne dans un canvas plutôt qu'en texte
+RENDU_TEXTE_MAX = 2500
+# Limites de la page : mémoire du navigateur (générateurs en O(h*w)) et taille de canvas
+# acceptée par tous les navigateurs (côté et surface en pixels)
+CELLULES_MAX    = 4_000_000
+CANVAS_COTE_MAX = 16384
+CANVAS_AIRE_MAX = 16384 * 1024
+_tache = None
+
+
+def _taille_cellule(h, w):
+    """
+    Côté d'une cellule en pixels dans le canvas (entre 1 et 10, pour une image d'environ 4000 pixels)
+    """
+    return max(1, min(10, 4000 // max(h, w)))
+
+
+def _verifier_dimensions(h, w):
+    """
+    Vérifie qu'un labyrinthe h x w peut être généré et affiché par la page
+    
+    Arguments:
+        h (int): hauteur du labyrinthe
+        w (int): largeur du labyrinthe
+    
+    Retour:
+        (str): message d'erreur, None si les dimensions sont acceptables
+    """
+    if h < 1 or w < 1:
+        return "Erreur : la hauteur et la largeur doivent être au moins 1"
+    if h*w > CELLULES_MAX:
+        return f"Erreur : {h}x{w} dépasse {CELLULES_MAX} cellules, trop pour la mémoire du navigateur"
+    taille = _taille_cellule(h, w)
+    if h*w > RENDU_TEXTE_MAX and (max(h, w)*taille + 1 > CANVAS_COTE_MAX
+                                   or (h*taille + 1)*(w*taille + 1) > CANVAS_AIRE_MAX):
+        return f"Erreur : {h}x{w} est trop grand pour être dessiné (côté maximal {CANVAS_COTE_MAX - 1})"
+    return None
+
+
+async def _avancer(etapes, libelle, periode=0.03):
+    """
+    Exécute une construction pas à pas en rendant la main à la boucle d'événements
+    environ toutes les `periode` secondes, en affichant l'avancement
+    
+    Arguments:
+        etapes (generator): générateur d'avancement (voir Maze.build_steps)
+        libelle (str): texte affiché devant le pourcentage
+        periode (float): durée maximale de calcul entre deux rendus de main
+        
+    Retour:
+        valeur renvoyée par le générateur
+    """
+    barre = document.querySelector("#progression")
+    statut = document.querySelector("#statut")
+    limite = time.perf_counter() + periode
+    try:
+        while True:
+            progres = next(etapes)
+            if time.perf_counter() >= limite:
+                barre.value = progres
+                statut.innerText = f"{libelle} : {progres:.0%}"
+                await asyncio.sleep(0)
+                limite = time.perf_counter() + periode
+    except StopIteration as fin:
+        barre.value = 1
+        return fin.value
+
+
+def _dessiner(laby, contexte, taille, path=None):
+    """
+    Dessine un labyrinthe dans un canvas, ligne par ligne ; les murs horizontaux
+    consécutifs sont fusionnés en un seul segment
+    
+    Arguments:
+        laby (Maze): labyrinthe à dessiner
+        contexte: contexte 2D du canvas
+        taille (int): côté d'une cellule en pixels
+        path (dict): chemin à colorier (format des méthodes solve_*)
+        
+    Retour:
+        générateur de l'avancement (float entre 0 et 1)
+    """
+    h, w = laby.height, laby.width
+    chemin = {}
+    for c in path or ():
+        chemin.setdefault(c[0], []).append(c[1])
+    contexte.fillStyle = "#ffffff"
+    contexte.fillRect(0, 0, w*taille + 1, h*taille + 1)
+    contexte.strokeStyle = "#000000"
+    contexte.lineWidth = 1
+    contexte.strokeRect(0.5, 0.5, w*taille, h*taille)
+    for i, (est, sud) in enumerate(laby.iter_rows()):
+        y = i*taille
+        contexte.fillStyle = "#e0483e"
+        for j in chemin.get(i, ()):
+            contexte.fillRect(j*taille + 1, y + 1, taille - 1, taille - 1)
+        contexte.beginPath()
+        for j in range(w - 1):
+            if est[j]:
+                contexte.moveTo((j+1)*taille + 0.5, y)
+                contexte.lineTo((j+1)*taille + 0.5, y + taille + 1)
+        if i < h - 1:
+            j = 0
+            while j < w:
+                if sud[j]:
+                    debut = j
+                    while j < w and sud[j]:
+                        j += 1
+                    contexte.moveTo(debut*taille, y + taille + 0.5)
+                    contexte.lineTo(j*taille + 1, y + taille + 0.5)
+                else:
+                    j += 1
+        contexte.stroke()
+        yield (i+1) / h
+
+
+async def _generer(algorithme, h, w, resoudre):
+    """
+    Génère, résout éventuellement et affiche un labyrinthe sans bloquer la page
+    
+    Arguments:
+        algorithme (str): nom du générateur
+        h (int): hauteur du labyrinthe
+        w (int): largeur du labyrinthe
+        resoudre (bool): afficher le chemin de (0,0) à (h-1,w-1)
+    """
     output_div = document.querySelector("#output")
+    canvas = document.querySelector("#canvas")
+    statut = document.querySelector("#statut")
+    statut.innerText = f"Génération {h}x{w}..."
+    document.querySelector("#progression").value = 0
+    try:
+        laby = await _avancer(Maze.build_steps(algorithme, h, w), "Génération")
+        path = None
+        if resoudre:
+            statut.innerText = "Résolution..."
+            await asyncio.sleep(0)
+            path = laby.solve_bfs((0,0),(h-1,w-1))
+        if h*w <= RENDU_TEXTE_MAX:
+            canvas.style.display = "none"
+            output_div.innerText = f"Le labyrinthe : \n{laby.overlay(path) if path else laby}"
+        else:
+            output_div.innerText = ""
+            taille = _taille_cellule(h, w)
+            canvas.width, canvas.height = w*taille + 1, h*taille + 1
+            canvas.style.display = "inline"
+            await _avancer(_dessiner(laby, canvas.getContext("2d"), taille, path), "Affichage")
+        statut.innerText = f"Labyrinthe {h}x{w} ({algorithme})"
+    except asyncio.CancelledError:
+        statut.innerText = "Génération annulée"
+        raise
+    except Exception as erreur:
+        # MemoryError en particulier : l'erreur est affichée au lieu de rester dans la tâche
+        document.querySelector("#progression").value = 0
+        statut.innerText = f"Erreur : {type(erreur).__name__}" + (f" ({erreur})" if str(erreur) else "")
+
+
+def genererLabyrinthe(event):
     height = document.querySelector("#labHeight").value
     width = document.querySelector("#labWidth").value
+    algorithme = document.querySelector("#algorithme").value
+    resoudre = document.querySelector("#resoudre").checked
     
-    laby = Maze.gen_wilson(int(height),int(width))
-    if document.querySelector("#resoudre").checked :
-        path = laby.solve_bfs((0,0),(int(height)-1,int(width)-1))
-        output_div.innerText = f"Le labyrinthe : \n{laby.overlay(path)}"
-    else:
-        output_div.innerText = f"Le labyrinthe : \n{laby}"
\ No newline at end of file
+    global _tache
+    annulerGeneration(event)
+    try:
+        h, w = int(height), int(width)
+    except ValueError:
+        document.querySelector("#statut").innerText = "Erreur : la hauteur et la largeur doivent être des entiers"
+        return
+    erreur = _verifier_dimensions(h, w)
+    if erreur is not None:
+        document.querySelector("#statut").innerText = erreur
+        return
+    _tache = asyncio.ensure_future(_generer(algorithme, h, w, resoudre))
+
+
+def annulerGeneration(event):
+    if _tache is not None and not _tache.done():
+        _tache.cancel()